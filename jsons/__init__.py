@@ -103,6 +103,9 @@ from jsons._extra_impl import (
     announce_class,
     suppress_warnings,
     suppress_warning,
+    persist_cache,
+    clear_cache,
+    set_executor,
 )
 from jsons._fork_impl import fork
 from jsons._key_transformers import (
@@ -122,7 +125,10 @@ from jsons._load_impl import (
     loads,
     loadb,
 )
+from jsons._lines_impl import dump_lines, load_lines
+from jsons._multitasking import shutdown_pools
 from jsons._package_info import __version__
+from jsons._stream_impl import dump_to, load_from, iter_load
 from jsons._transform_impl import transform
 from jsons._validation import (
     validate,
@@ -192,9 +198,14 @@ __all__ = [
     dump.__name__,
     dumps.__name__,
     dumpb.__name__,
+    dump_to.__name__,
     load.__name__,
     loads.__name__,
     loadb.__name__,
+    load_from.__name__,
+    iter_load.__name__,
+    dump_lines.__name__,
+    load_lines.__name__,
     transform.__name__,
     fork.__name__,
     set_serializer.__name__,
@@ -207,6 +218,10 @@ __all__ = [
     'announce_class',
     suppress_warnings.__name__,
     suppress_warning.__name__,
+    persist_cache.__name__,
+    clear_cache.__name__,
+    set_executor.__name__,
+    shutdown_pools.__name__,
 
     # Types:
     JsonSerializable.__name__,
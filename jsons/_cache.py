@@ -3,25 +3,67 @@ PRIVATE MODULE: do not import (from) it directly.
 
 This module contains functionality for caching functions.
 """
+import inspect
 from collections import deque
 from functools import lru_cache, update_wrapper
-from typing import Callable
+from threading import Lock
+from typing import Callable, Optional
+
+DEFAULT_MAX_SIZE = 1024  # The number of cached results per function.
+
+_active_calls = 0  # The number of running calls of e.g. dump and load.
+_active_calls_lock = Lock()
+_clear_hooks = []  # Functions that clear caches that are not kept by cached.
 
 
 class _Wrapper:
     """
     A wrapper around a function that needs to be cached. This wrapper allows
     for a single point from which cache can be cleared.
+
+    If the wrapped function has a ``fork_inst`` parameter, the generation of
+    that fork is part of the cache key. Changing the registries of a fork
+    thus invalidates the cached results of that fork only.
     """
     instances = deque([])
+    persistent = True
+    max_size = DEFAULT_MAX_SIZE
 
     def __init__(self, wrapped):
         self.wrapped = wrapped
+        self.fork_index, self.fork_default = _get_fork_param(wrapped)
+        self.cached = self._create_cache()
         self.instances.append(self)
 
-    @lru_cache(typed=True)
     def __call__(self, *args, **kwargs):
-        return self.wrapped(*args, **kwargs)
+        if self.fork_index is None:
+            return self.cached(*args, **kwargs)
+        if 'fork_inst' in kwargs:
+            fork_inst = kwargs['fork_inst']
+        elif len(args) > self.fork_index:
+            fork_inst = args[self.fork_index]
+        else:
+            fork_inst = self.fork_default
+        generation = getattr(fork_inst, '_generation', 0)
+        return self.cached(generation, *args, **kwargs)
+
+    def _create_cache(self):
+        func = self.wrapped
+        if self.fork_index is not None:
+            def func(_generation, *args, **kwargs):
+                return self.wrapped(*args, **kwargs)
+        return lru_cache(maxsize=self.max_size, typed=True)(func)
+
+
+def _get_fork_param(func: Callable) -> tuple:
+    # Return the position and default of the fork_inst parameter of func.
+    params = list(inspect.signature(func).parameters.values())
+    for index, param in enumerate(params):
+        if param.name == 'fork_inst':
+            if param.kind == param.KEYWORD_ONLY:
+                index = len(params)
+            return index, param.default
+    return None, None
 
 
 def cached(decorated: Callable):
@@ -43,4 +85,80 @@ def clear():
     :return: None.
     """
     for w in _Wrapper.instances:
-        w.__call__.cache_clear()
+        w.cached.cache_clear()
+    for hook in _clear_hooks:
+        hook()
+
+
+def add_clear_hook(hook: Callable[[], None]):
+    """
+    Register a function that clears a cache that is not kept by ``cached``
+    (e.g. a lookup table). The function is called by ``clear()``.
+    :param hook: a function without parameters.
+    :return: None.
+    """
+    _clear_hooks.append(hook)
+
+
+def get_max_size() -> int:
+    """
+    Return the maximum number of results that are cached per function. Other
+    caches (e.g. lookup tables) are bounded by this size as well.
+    :return: the maximum size of a cache.
+    """
+    return _Wrapper.max_size
+
+
+def start_call():
+    """
+    Register the start of a call of e.g. ``dump`` or ``load``. The temporary
+    cache is not cleared while any such call is running (e.g. on another
+    thread), as that call may still depend on it.
+    :return: None.
+    """
+    global _active_calls
+    with _active_calls_lock:
+        _active_calls += 1
+
+
+def end_call():
+    """
+    Register the end of a call that was started with ``start_call``. The cache
+    is cleared if it is not persistent and no other calls are running.
+    :return: None.
+    """
+    global _active_calls
+    with _active_calls_lock:
+        _active_calls -= 1
+        if not _active_calls:
+            clear_temporary()
+
+
+def clear_temporary():
+    """
+    Clear all cache of functions that were cached using ``cached``, unless the
+    cache is persistent.
+    :return: None.
+    """
+    if not _Wrapper.persistent:
+        clear()
+
+
+def set_persistent(persistent: bool, max_size: Optional[int] = None):
+    """
+    Determine whether cached results survive the call of ``dump`` or ``load``
+    that produced them. If a ``max_size`` is given, the caches of all cached
+    functions are replaced by caches of that size.
+    :param persistent: if ``True``, the cache of a fork is only invalidated
+    when its (de)serializers or validators change.
+    :param max_size: the maximum number of results that are cached per
+    function, ``None`` to keep the current size.
+    :return: None.
+    """
+    _Wrapper.persistent = persistent
+    if max_size is not None and max_size != _Wrapper.max_size:
+        _Wrapper.max_size = max_size
+        for w in _Wrapper.instances:
+            w.cached = w._create_cache()
+    if not persistent:
+        clear()
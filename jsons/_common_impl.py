@@ -7,6 +7,7 @@ throughout `jsons`.
 import builtins
 import warnings
 from importlib import import_module
+from threading import RLock
 from typing import Callable, Optional, Tuple, TypeVar, Any
 
 from jsons._cache import cached
@@ -29,11 +30,16 @@ class StateHolder:
     _classes_deserializers = list()
     _serializers = dict()
     _deserializers = dict()
+    _serializers_dispatch = dict()  # Resolved serializers by type.
+    _deserializers_dispatch = dict()  # Resolved deserializers by type.
     _validators = dict()
     _classes_validators = list()
     _announced_classes = dict()
     _suppress_warnings = False
     _suppressed_warnings = set()
+    _generation = 0  # Increases with every change to the registries.
+    _executor = None  # Runs the tasks if tasks > 1, a default pool if None.
+    _lock = RLock()  # Held while changing the registries.
 
     @classmethod
     def _warn(cls, msg, code, *args, **kwargs):
@@ -42,6 +48,57 @@ class StateHolder:
                     'turn off this message.'.format(msg, code))
             warnings.warn(msg_, *args, **kwargs)
 
+    @classmethod
+    def _bump_generation(cls, registry: str):
+        """
+        Increase the generation of this fork and of all other forks that
+        share the given registry (e.g. ``'_validators'``) with this fork.
+        Cached results of older generations will no longer be used.
+        :param registry: the name of the registry that has been changed.
+        :return: None.
+        """
+        changed = getattr(cls, registry)
+        with cls._lock:
+            holders = [StateHolder]
+            while holders:
+                holder = holders.pop()
+                holders.extend(holder.__subclasses__())
+                if getattr(holder, registry) is changed:
+                    holder._generation += 1
+
+    @classmethod
+    def _reset_dispatch(cls):
+        """
+        Replace the tables of resolved (de)serializers of this fork and of
+        all forks that derive from it by empty tables.
+        :return: None.
+        """
+        with cls._lock:
+            holders = [cls]
+            while holders:
+                holder = holders.pop()
+                holders.extend(holder.__subclasses__())
+                for table in ('_serializers_dispatch',
+                              '_deserializers_dispatch'):
+                    if table in vars(holder):
+                        setattr(holder, table, dict())
+
+    @classmethod
+    def _replace_registry(cls, registry: str, value: object):
+        """
+        Replace the given registry (e.g. ``'_validators'``) of this fork by
+        ``value``. The registry is replaced on the class that holds it, so
+        all forks that share the registry keep sharing it. Registries are
+        replaced rather than changed in place, such that (de)serializations
+        on other threads never see a registry that is partially changed.
+        :param registry: the name of the registry that is to be replaced.
+        :param value: the new registry.
+        :return: None.
+        """
+        owner = next(holder for holder in cls.__mro__
+                     if registry in vars(holder))
+        setattr(owner, registry, value)
+
 
 @cached
 def get_class_name(cls: type,
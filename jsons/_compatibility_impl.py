@@ -49,10 +49,10 @@ def tuple_with_ellipsis(tup: type) -> bool:
     return use_el
 
 
-@cached
 def get_union_params(un: type) -> list:
     # Python3.5: Unions have __union_params__
     # Python3.7: Unions have __args__
+    # Not cached, as Unions that only differ in order are equal.
     return getattr(un, '__union_params__', getattr(un, '__args__', None))
 
 
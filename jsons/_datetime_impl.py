@@ -3,13 +3,32 @@ PRIVATE MODULE: do not import (from) it directly.
 
 This module contains functionality for ``datetime`` related stuff.
 """
-from datetime import datetime, timezone, timedelta, time, date
-from typing import Union
+import re
+from datetime import datetime, timezone, timedelta, time, date, tzinfo
+from time import time as timestamp
+from typing import Optional, Union
 
 RFC3339_DATE_PATTERN = '%Y-%m-%d'
 RFC3339_TIME_PATTERN = '%H:%M:%S'
 RFC3339_DATETIME_PATTERN = '{}T{}'.format(
     RFC3339_DATE_PATTERN, RFC3339_TIME_PATTERN)
+FRACTION_REGEX = re.compile(r'(\.[0-9]+)')
+DIGITS = '0123456789'
+
+MAX_TIMEZONES = 1024  # The maximum number of interned timezones.
+
+# The interned timezone instances by offset string (e.g. '+01:00') or by
+# (offset, name).
+_timezones = {}
+_offset_strs = {}  # The timezones with their name and offset string.
+_local_timezone = (None, None)  # The epoch minute and the local timezone.
+_fromisoformat = getattr(datetime, 'fromisoformat', None)  # Python 3.7+.
+_ISO_LENGTHS = {
+    # The lengths of isoformat() without and with fraction by type and pattern.
+    (datetime, RFC3339_DATETIME_PATTERN): (19, 26),
+    (date, RFC3339_DATE_PATTERN): (10, 10),
+    (time, RFC3339_TIME_PATTERN): (8, 15),
+}
 
 
 def to_str(
@@ -17,12 +36,37 @@ def to_str(
         strip_microseconds: bool,
         fork_inst: type,
         pattern: str = RFC3339_DATETIME_PATTERN) -> str:
+    lengths = _ISO_LENGTHS.get((type(dt), pattern))
+    if not lengths or getattr(dt, 'year', 1000) < 1000:
+        # strftime output (e.g. of unpadded years before 1000) is kept as is.
+        return _to_str_with_strftime(dt, strip_microseconds, fork_inst,
+                                     pattern)
+    offset = get_offset_str(dt, fork_inst)
+    with_fraction = not strip_microseconds and getattr(dt, 'microsecond', 0)
+    return _naive_isoformat(dt)[:lengths[bool(with_fraction)]] + offset
+
+
+def _to_str_with_strftime(
+        dt: Union[datetime, date],
+        strip_microseconds: bool,
+        fork_inst: type,
+        pattern: str) -> str:
     offset = get_offset_str(dt, fork_inst)
     if not strip_microseconds and getattr(dt, 'microsecond', None):
         pattern += '.%f'
     return dt.strftime("{}{}".format(pattern, offset))
 
 
+def _naive_isoformat(dt: Union[datetime, date, time]) -> str:
+    # Return dt.isoformat() without any offset, without calling its tzinfo.
+    if getattr(dt, 'tzinfo', None):
+        if isinstance(dt, datetime):
+            dt = datetime.combine(dt, dt.time())
+        else:
+            dt = time(dt.hour, dt.minute, dt.second, dt.microsecond)
+    return dt.isoformat()
+
+
 def get_offset_str(
         obj: Union[datetime, date, timedelta],
         fork_inst: type) -> str:
@@ -40,6 +84,44 @@ def get_offset_str(
     return result
 
 
+def parse_datetime(obj: str) -> datetime:
+    """
+    Return a datetime instance with timezone info from the given ``obj`` in
+    RFC3339 format. The common form ``YYYY-MM-DDTHH:MM:SS[.fraction]`` with an
+    offset (e.g. ``+01:00``) or a ``Z`` is parsed directly. Anything else is
+    parsed with ``strptime``, which also determines the errors that are
+    raised for invalid values.
+    :param obj: the ``obj`` in RFC3339 format.
+    :return: a datetime instance with timezone info.
+    """
+    result = None
+    if _fromisoformat:
+        result = _parse_common_datetime(obj)
+    if not result:
+        pattern = RFC3339_DATETIME_PATTERN
+        if '.' in obj:
+            pattern += '.%f'
+            # strptime allows a fraction of length 6, so trim the rest.
+            frac = FRACTION_REGEX.search(obj).group()
+            obj = obj.replace(frac, frac[0:7])
+        result = get_datetime_inst(obj, pattern)
+    return result
+
+
+def may_be_datetime(obj: str) -> bool:
+    """
+    Return whether ``obj`` might be parsed to a datetime. If ``False`` is
+    returned, ``parse_datetime`` would certainly fail on ``obj``.
+    :param obj: the string that is to be checked.
+    :return: ``False`` if ``obj`` is certainly not a datetime.
+    """
+    # The shortest datetime is like '2018-7-8T1:4:0Z'. The year has exactly
+    # 4 (possibly non-ASCII) digits and the 'T' follows a month and a day of
+    # 1 or 2 digits each. It may be lowercase, as strptime ignores case.
+    return (len(obj) >= 15 and obj[4] == '-' and obj[:4].isdecimal()
+            and 'T' in obj[8:11].upper())
+
+
 def get_datetime_inst(obj: str, pattern: str) -> datetime:
     """
     Return a datetime instance with timezone info from the given ``obj``.
@@ -56,6 +138,77 @@ def get_datetime_inst(obj: str, pattern: str) -> datetime:
     return result
 
 
+def _parse_common_datetime(obj: str) -> Optional[datetime]:
+    # Return the datetime of obj if it has the common RFC3339 form, or None
+    # if it has not or if it is invalid.
+    if obj[-1:] == 'Z':
+        naive, tzinfo = obj[:-1], timezone.utc
+    else:
+        naive, offset = obj[:-6], obj[-6:]
+        tzinfo = _timezones.get(offset)
+        if not tzinfo:
+            if (offset[:1] not in ('+', '-') or offset[3:4] != ':'
+                    or (offset[1:3] + offset[4:]).lstrip(DIGITS)):
+                return None
+            try:
+                tzinfo = _get_timezone(offset)
+            except ValueError:
+                return None
+    # The separators are at positions 4, 7, 10, 13 and 16.
+    if naive[4:17:3] != '--T::' or naive[11:13] > '23':
+        return None
+    if len(naive) != 19:
+        frac = naive[20:]
+        if naive[19:20] != '.' or not frac or frac.lstrip(DIGITS):
+            return None
+        if len(frac) not in (3, 6):
+            # Use a fraction of 6 digits, like strptime would.
+            naive = naive[:20] + frac[:6].ljust(6, '0')
+    try:
+        naive_dt = _fromisoformat(naive)
+    except ValueError:
+        return None
+    # This is much faster than naive_dt.replace(tzinfo=tzinfo).
+    return datetime.combine(naive_dt, naive_dt.time(), tzinfo)
+
+
+def _get_timezone(offset: str) -> timezone:
+    # Return a timezone for the given offset (e.g. '+01:00'). Equal offsets
+    # share the same timezone instance.
+    result = _timezones.get(offset)
+    if not result:
+        factor = -1 if offset[0] == '-' else 1
+        hrs_str, mins_str = offset[1:].split(':')
+        hrs = int(hrs_str) * factor
+        mins = int(mins_str) * factor
+        result = timezone(offset=timedelta(hours=hrs, minutes=mins))
+        _intern(_timezones, offset, result)
+    return result
+
+
+def get_timezone(offset: timedelta, name: str) -> timezone:
+    """
+    Return a timezone with the given offset and name. Equal timezones share
+    the same instance, as long as there are not too many of them.
+    :param offset: the offset of the timezone.
+    :param name: the name of the timezone.
+    :return: a ``datetime.timezone`` instance.
+    """
+    key = (offset, name)
+    result = _timezones.get(key)
+    if not result:
+        result = timezone(offset, name)
+        _intern(_timezones, key, result)
+    return result
+
+
+def _intern(table: dict, key: object, value: object) -> None:
+    # Store value under key in table, unless table is full. Values that were
+    # interned first (i.e. the most common ones) are thus kept.
+    if len(table) < MAX_TIMEZONES:
+        table[key] = value
+
+
 def _datetime_offset_str(obj: datetime, fork_inst: type) -> str:
     """
     Return a textual offset (e.g. +01:00 or Z) for the given datetime.
@@ -68,9 +221,23 @@ def _datetime_offset_str(obj: datetime, fork_inst: type) -> str:
         fork_inst._warn('The use of datetimes without timezone is dangerous '
                         'and can lead to undesired results.',
                         'datetime-without-tz')
-        tzone = datetime.now(timezone.utc).astimezone().tzinfo
+        tzone = _get_local_timezone()
         if tzone is timezone.utc or tzone.utc is timezone.utc:
             return '+00:00'
+    if type(tzone) is not timezone:
+        return _tzinfo_offset_str(obj, tzone)
+    # The offset string of a timezone depends on its name and offset only, so
+    # it is reused for all equal timezones with the same name.
+    entry = _offset_strs.get(tzone)
+    if not entry or (entry[0] is not tzone
+                     and entry[1] != tzone.tzname(None)):
+        entry = (tzone, tzone.tzname(None), _tzinfo_offset_str(obj, tzone))
+        _intern(_offset_strs, tzone, entry)
+    return entry[2]
+
+
+def _tzinfo_offset_str(obj: datetime, tzone: tzinfo) -> str:
+    # Return the textual offset for obj with the given tzinfo.
     offset = 'Z'
     if tzone.tzname(None) not in ('UTC', 'UTC+00:00'):
         tdelta = tzone.utcoffset(None) or \
@@ -79,6 +246,19 @@ def _datetime_offset_str(obj: datetime, fork_inst: type) -> str:
     return offset
 
 
+def _get_local_timezone() -> tzinfo:
+    # Return the local timezone. It may change (e.g. at the start of daylight
+    # saving time), which happens at the start of a minute, so it is resolved
+    # again every minute.
+    global _local_timezone
+    minute = int(timestamp() // 60)
+    cached_minute, tzone = _local_timezone
+    if minute != cached_minute:
+        tzone = datetime.now(timezone.utc).astimezone().tzinfo
+        _local_timezone = (minute, tzone)
+    return tzone
+
+
 def _timedelta_offset_str(tdelta: timedelta) -> str:
     """
     Return a textual offset (e.g. +01:00 or Z) for the given timedelta.
@@ -114,14 +294,11 @@ def _datetime_offset_inst(obj: str, pattern: str) -> datetime:
     :return: a datetime instance with timezone info.
     """
     dat_str, tim_str = obj.split('T')
-    splitter, factor = ('+', 1) if '+' in tim_str else ('-', -1)
+    splitter = '+' if '+' in tim_str else '-'
     naive_tim_str, offset = tim_str.split(splitter)
     naive_dattim_str = '{}T{}'.format(dat_str, naive_tim_str)
     dattim_obj = datetime.strptime(naive_dattim_str, pattern)
-    hrs_str, mins_str = offset.split(':')
-    hrs = int(hrs_str) * factor
-    mins = int(mins_str) * factor
-    tz = timezone(offset=timedelta(hours=hrs, minutes=mins))
+    tz = _get_timezone(splitter + offset)
     return _new_datetime(dattim_obj.date(), dattim_obj.time(), tz)
 
 
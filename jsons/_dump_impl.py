@@ -6,11 +6,12 @@ This module contains functionality for dumping stuff to json.
 import json
 from typing import Optional, Dict
 
-from jsons._cache import clear
-from jsons._common_impl import StateHolder
+from jsons._cache import cached, start_call, end_call
+from jsons._common_impl import StateHolder, JSON_KEYS
 from jsons._extra_impl import announce_class
 from jsons._lizers_impl import get_serializer
 from jsons.exceptions import SerializationError
+from jsons.serializers.default_primitive import default_primitive_serializer
 
 
 def dump(obj: object,
@@ -40,6 +41,9 @@ def dump(obj: object,
     :return: the serialized obj as a JSON type.
     """
     cls_ = cls or obj.__class__
+    if cls_ is obj.__class__ and cls_ in get_native_types(fork_inst):
+        # A JSON native value (e.g. an int) is dumped as it is.
+        return obj
     serializer = get_serializer(cls_, fork_inst)
 
     # Is this the initial call or a nested?
@@ -52,20 +56,56 @@ def dump(obj: object,
         **kwargs
     }
     announce_class(cls_, fork_inst=fork_inst)
-    return _do_dump(obj, serializer, cls, initial, kwargs_)
+    if not initial:
+        return dump_with_serializer(obj, serializer, cls, kwargs_)
+    start_call()
+    try:
+        return dump_with_serializer(obj, serializer, cls, kwargs_)
+    finally:
+        # Temporary caches are cleared once the last initial call is done.
+        end_call()
 
 
-def _do_dump(obj, serializer, cls, initial, kwargs):
+def dump_with_serializer(
+        obj: object,
+        serializer: callable,
+        cls: Optional[type],
+        kwargs: dict) -> object:
+    """
+    Serialize ``obj`` with the given serializer, like ``dump`` does once it
+    has looked up that serializer. This allows for looking up a serializer
+    only once for many objects.
+    :param obj: the object that is to be serialized.
+    :param serializer: the serializer function of (the type of) ``obj``.
+    :param cls: the type that is passed on to the serializer, if any.
+    :param kwargs: the keyword arguments for the serializer; these must
+    include ``fork_inst``.
+    :return: the serialized ``obj``.
+    """
     try:
-        result = serializer(obj, cls=cls, **kwargs)
-        if initial:
-            clear()
-        return result
+        return serializer(obj, cls=cls, **kwargs)
     except Exception as err:
-        clear()
         raise SerializationError(str(err)) from err
 
 
+@cached
+def get_native_types(fork_inst: type = StateHolder) -> frozenset:
+    """
+    Return the JSON native types (e.g. ``int``) that the given fork dumps as
+    they are, i.e. the types without a custom serializer. A value of such a
+    type can be used directly in the result of a dump.
+    :param fork_inst: the fork of ``JsonSerializable`` that is used.
+    :return: a set of types.
+    """
+    result = frozenset(cls for cls in JSON_KEYS
+                       if get_serializer(cls, fork_inst)
+                       is default_primitive_serializer)
+    for cls in result:
+        # These classes are no longer announced when they are dumped.
+        announce_class(cls, fork_inst=fork_inst)
+    return result
+
+
 def dumps(obj: object,
           jdkwargs: Optional[Dict[str, object]] = None,
           *args,
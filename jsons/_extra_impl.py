@@ -4,9 +4,10 @@ PRIVATE MODULE: do not import (from) it directly.
 This module contains implementations that do not directly touch the core of
 jsons.
 """
+from concurrent.futures import Executor
 from typing import Optional
 
-from jsons._cache import cached
+from jsons._cache import clear, set_persistent
 from jsons._common_impl import StateHolder, get_class_name
 
 
@@ -35,7 +36,6 @@ def suppress_warning(
     fork_inst._suppressed_warnings |= {code}
 
 
-@cached
 def announce_class(
         cls: type,
         cls_name: Optional[str] = None,
@@ -49,5 +49,54 @@ def announce_class(
     :return: None.
     """
     cls_name = cls_name or get_class_name(cls, fully_qualified=True)
-    fork_inst._announced_classes[cls] = cls_name
-    fork_inst._announced_classes[cls_name] = cls
+    if _is_announced(cls, cls_name, fork_inst._announced_classes):
+        return
+    with fork_inst._lock:
+        announced = fork_inst._announced_classes
+        if not _is_announced(cls, cls_name, announced):
+            # No cached results depend on the announced classes, so there is
+            # no need to bump the generation.
+            announced = {**announced, cls: cls_name, cls_name: cls}
+            fork_inst._replace_registry('_announced_classes', announced)
+
+
+def _is_announced(cls: type, cls_name: str, announced: dict) -> bool:
+    return announced.get(cls) == cls_name and announced.get(cls_name) is cls
+
+
+def set_executor(
+        executor: Optional[Executor],
+        fork_inst: Optional[type] = StateHolder):
+    """
+    Set the executor (e.g. a ``ThreadPoolExecutor``) that runs the tasks when
+    (de)serializing with ``tasks`` greater than 1. If no executor is set, a
+    persistent pool of the given ``task_type`` is used.
+    :param executor: the executor that is to be used or ``None`` to use the
+    default pools.
+    :param fork_inst: if given, it uses this fork of ``JsonSerializable``.
+    :return: None.
+    """
+    fork_inst._executor = executor
+
+
+def persist_cache(
+        do_persist: Optional[bool] = True,
+        max_size: Optional[int] = None):
+    """
+    Keep (or stop keeping) cached results (e.g. resolved serializers) across
+    calls to ``dump`` and ``load``. Persistent cache of a fork is only
+    invalidated when a serializer, deserializer or validator is set on that
+    fork. Non-persistent cache is cleared after every call.
+    :param do_persist: if ``True``, cache will persist from now on.
+    :param max_size: the maximum number of cached results per function.
+    :return: None.
+    """
+    set_persistent(do_persist, max_size)
+
+
+def clear_cache():
+    """
+    Clear all cached results (e.g. resolved serializers).
+    :return: None.
+    """
+    clear()
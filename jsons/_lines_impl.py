@@ -0,0 +1,256 @@
+"""
+PRIVATE MODULE: do not import (from) it directly.
+
+This module contains functionality for dumping and loading JSON Lines (i.e.
+newline delimited JSON).
+"""
+import codecs
+import json
+from collections import deque
+from concurrent.futures import Executor, wait, FIRST_COMPLETED
+from json import JSONDecodeError
+from multiprocessing import Process
+from typing import Optional, Dict, Iterable, Iterator, Callable, Type, Tuple
+
+from jsons._cache import start_call, end_call
+from jsons._common_impl import StateHolder, T
+from jsons._dump_impl import dump_with_serializer
+from jsons._extra_impl import announce_class
+from jsons._lizers_impl import get_serializer
+from jsons._load_impl import get_loader
+from jsons._multitasking import get_executor
+from jsons._stream_impl import BUFFER_SIZE, _Writer, _is_binary
+from jsons.exceptions import DeserializationError, DecodeError, JsonsError
+
+CHUNK_SIZE = 2 ** 20  # The number of characters that is sent to a worker.
+
+
+def dump_lines(objs: Iterable,
+               fp: object,
+               cls: Optional[type] = None,
+               encoding: str = 'utf-8',
+               jdkwargs: Optional[Dict[str, object]] = None,
+               *,
+               strict: bool = False,
+               fork_inst: Optional[type] = StateHolder,
+               **kwargs) -> None:
+    """
+    Dump every object in ``objs`` as JSON to the file-like object ``fp``, each
+    on a line of its own (JSON Lines). Every line equals what ``dumps`` would
+    produce for that object, but the serializer is looked up only once for
+    every distinct type of object.
+
+    If the serialization of an object fails, the lines of all objects before
+    it have been written.
+
+    :param objs: an iterable of objects that are to be dumped.
+    :param fp: a file-like object with a ``write`` method.
+    :param cls: if given, every object is dumped as if it is of type ``cls``.
+    :param encoding: the encoding that is used for binary streams.
+    :param jdkwargs: extra keyword arguments for ``json.dumps`` (not
+    ``jsons.dumps``!). Any ``indent`` is ignored.
+    :param strict: a bool to determine if the serializer should be strict.
+    :param fork_inst: if given, it uses this fork of ``JsonSerializable``.
+    :param kwargs: the keyword args are passed on to the serializer function.
+    :return: None.
+    """
+    jdkwargs_ = {**(jdkwargs or {}), 'indent': None}
+    writer = _Writer(fp, encoding, jdkwargs_, fork_inst)
+    kwargs_ = {
+        'fork_inst': fork_inst,
+        '_initial': False,
+        'strict': strict,
+        **kwargs
+    }
+    serializers = {}
+    start_call()
+    try:
+        for obj in objs:
+            cls_ = cls or obj.__class__
+            if cls_ is obj.__class__ and cls_ in writer.native_types:
+                dumped = obj
+            else:
+                serializer = serializers.get(cls_)
+                if not serializer:
+                    serializer = get_serializer(cls_, fork_inst)
+                    announce_class(cls_, fork_inst=fork_inst)
+                    serializers[cls_] = serializer
+                dumped = dump_with_serializer(obj, serializer, cls, kwargs_)
+            writer.write_value(dumped, 0)
+            writer.write('\n')
+    finally:
+        writer.flush()
+        end_call()
+
+
+def load_lines(fp: object,
+               cls: Optional[Type[T]] = None,
+               encoding: str = 'utf-8',
+               jdkwargs: Optional[Dict[str, object]] = None,
+               *,
+               workers: int = 1,
+               ordered: bool = True,
+               strict: bool = False,
+               fork_inst: Optional[type] = StateHolder,
+               attr_getters: Optional[Dict[str, Callable[[], object]]] = None,
+               **kwargs) -> Iterator[T]:
+    """
+    Return a generator that loads the JSON on every line of the file-like
+    object ``fp`` (JSON Lines) into a dict or a Python instance of type
+    ``cls``. The lines are read when the generator reaches them. Empty lines
+    are skipped. The deserializer of ``cls`` is looked up only once for all
+    lines.
+
+    If ``workers`` is greater than 1, ``fp`` is read in chunks of whole lines
+    that are parsed and deserialized in a persistent pool of that many
+    processes (or by the executor that was set with ``set_executor``). The
+    results are yielded in the order of the lines, unless ``ordered`` is
+    ``False``, in which case the lines of every chunk are yielded as soon as
+    that chunk is done. The loaded instances must then be picklable. If the
+    arguments of this function (e.g. a fork or a lambda) cannot be pickled,
+    the lines are loaded in this process instead.
+
+    :param fp: a file-like object with a ``read`` method.
+    :param cls: a matching class of which instances should be yielded.
+    :param encoding: the encoding that is used for binary streams.
+    :param jdkwargs: extra keyword arguments for ``json.JSONDecoder`` (not
+    ``jsons.load``!)
+    :param workers: the number of processes that load the lines.
+    :param ordered: if ``False`` and ``workers`` is greater than 1, lines
+    may be yielded in a different order than they appear in ``fp``.
+    :param strict: a bool to determine if the deserializer should be strict.
+    :param fork_inst: if given, it uses this fork of ``JsonSerializable``.
+    :param attr_getters: a ``dict`` that may hold callables that return values
+    for certain attributes.
+    :param kwargs: the keyword args are passed on to the deserializer function.
+    :return: a generator of JSON-type objects or instances of type ``cls``.
+    """
+    if workers < 1:
+        raise JsonsError('Invalid number of workers: {}'.format(workers))
+    kwargs_ = {
+        **kwargs,
+        'strict': strict,
+        'fork_inst': fork_inst,
+        'attr_getters': attr_getters,
+        '_initial': False,
+    }
+    args = (cls, jdkwargs, kwargs_)
+    executor = None
+    if workers > 1:
+        executor = get_executor(Process, workers, fork_inst, args)
+    if executor:
+        chunks = _read_chunks(fp, encoding)
+        return _load_in_workers(chunks, executor, workers, ordered, args)
+    lines = _read_lines(fp, encoding)
+    return _load_lines(lines, 1, cls, jdkwargs, kwargs_)
+
+
+def _load_lines(lines: Iterable[str],
+                first_line_nr: int,
+                cls: Optional[type],
+                jdkwargs: Optional[Dict[str, object]],
+                kwargs: dict) -> Iterator:
+    jdkwargs_ = {**(jdkwargs or {})}
+    decoder_cls = jdkwargs_.pop('cls', None) or json.JSONDecoder
+    decoder = decoder_cls(**jdkwargs_)
+    loader = get_loader(cls, **kwargs)
+    start_call()
+    try:
+        for line_nr, line in enumerate(lines, start=first_line_nr):
+            if not line or line.isspace():
+                continue
+            try:
+                json_obj = decoder.decode(line)
+            except JSONDecodeError as err:
+                raise DecodeError('Could not load line {}; it is not valid '
+                                  'JSON.'.format(line_nr), line, cls,
+                                  err) from err
+            try:
+                loaded = loader(json_obj)
+            except DeserializationError as err:
+                new_msg = ('Could not deserialize line {}. {}'
+                           .format(line_nr, err.message))
+                raise DeserializationError(
+                    new_msg, err.source, err.target) from err
+            yield loaded
+    finally:
+        end_call()
+
+
+def _load_in_workers(
+        chunks: Iterator[Tuple[int, str]],
+        executor: Executor,
+        workers: int,
+        ordered: bool,
+        args: tuple) -> Iterator:
+    # Yield the loaded lines of all chunks, loading the chunks with executor.
+    # Only a limited number of chunks is read ahead.
+    pending = deque()
+    try:
+        for first_line_nr, text in chunks:
+            pending.append(executor.submit(
+                _load_chunk, text, first_line_nr, *args))
+            while len(pending) >= 2 * workers:
+                yield from _pop_loaded(pending, ordered)
+        while pending:
+            yield from _pop_loaded(pending, ordered)
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _pop_loaded(pending: deque, ordered: bool) -> list:
+    # Remove a finished chunk from pending and return its loaded lines.
+    if ordered:
+        future = pending.popleft()
+    else:
+        future = next(iter(wait(pending, return_when=FIRST_COMPLETED).done))
+        pending.remove(future)
+    return future.result()
+
+
+def _load_chunk(text: str, first_line_nr: int, *args) -> list:
+    # Load all lines of text; this is done by a worker process.
+    return list(_load_lines(text.split('\n'), first_line_nr, *args))
+
+
+def _read_chunks(fp: object, encoding: str) -> Iterator[Tuple[int, str]]:
+    # Yield chunks of whole lines of fp along with the number of the first
+    # line of every chunk.
+    line_nr = 1
+    rest = ''
+    for text in _read_text(fp, encoding, CHUNK_SIZE):
+        text = rest + text
+        end = text.rfind('\n') + 1
+        chunk, rest = text[:end], text[end:]
+        if chunk:
+            yield line_nr, chunk
+            line_nr += chunk.count('\n')
+    if rest:
+        yield line_nr, rest
+
+
+def _read_lines(fp: object, encoding: str) -> Iterator[str]:
+    # Yield the lines of fp without their line endings, reading fp in chunks.
+    rest = ''
+    for text in _read_text(fp, encoding, BUFFER_SIZE):
+        lines = (rest + text).split('\n')
+        rest = lines.pop()
+        yield from lines
+    if rest:
+        yield rest
+
+
+def _read_text(fp: object, encoding: str, size: int) -> Iterator[str]:
+    # Yield the contents of fp in chunks of text.
+    text_decoder = None
+    if _is_binary(fp):
+        text_decoder = codecs.getincrementaldecoder(encoding)()
+    eof = False
+    while not eof:
+        chunk = fp.read(size)
+        eof = not chunk
+        if text_decoder:
+            chunk = text_decoder.decode(chunk, final=eof)
+        if chunk:
+            yield chunk
@@ -4,9 +4,10 @@ PRIVATE MODULE: do not import (from) it directly.
 This module contains functionality for setting and getting serializers and
 deserializers.
 """
-from typing import Optional, Dict, Sequence, Union
+from abc import ABCMeta
+from typing import Optional, Sequence, Union
 
-from jsons._cache import cached
+from jsons._cache import add_clear_hook, cached, get_max_size
 from jsons._common_impl import StateHolder, get_class_name
 from jsons._compatibility_impl import get_naked_class
 
@@ -37,13 +38,8 @@ def set_serializer(
     if isinstance(cls, Sequence):
         for cls_ in cls:
             set_serializer(func, cls_, high_prio, fork_inst)
-    elif cls:
-        index = 0 if high_prio else len(fork_inst._classes_serializers)
-        fork_inst._classes_serializers.insert(index, cls)
-        cls_name = get_class_name(cls, fully_qualified=True)
-        fork_inst._serializers[cls_name.lower()] = func
     else:
-        fork_inst._serializers['nonetype'] = func
+        _set_lizer(func, cls, high_prio, 'serializers', fork_inst)
 
 
 def set_deserializer(
@@ -73,16 +69,36 @@ def set_deserializer(
     if isinstance(cls, Sequence):
         for cls_ in cls:
             set_deserializer(func, cls_, high_prio, fork_inst)
-    elif cls:
-        index = 0 if high_prio else len(fork_inst._classes_deserializers)
-        fork_inst._classes_deserializers.insert(index, cls)
-        cls_name = get_class_name(cls, fully_qualified=True)
-        fork_inst._deserializers[cls_name.lower()] = func
     else:
-        fork_inst._deserializers['nonetype'] = func
+        _set_lizer(func, cls, high_prio, 'deserializers', fork_inst)
+
+
+def _set_lizer(
+        func: callable,
+        cls: Optional[type],
+        high_prio: bool,
+        kind: str,
+        fork_inst: type) -> None:
+    # Register func for cls; kind is either 'serializers' or 'deserializers'.
+    # The registries are replaced by changed copies in an order that allows
+    # other threads to read them without locking: a class is only in the list
+    # of classes once its lizer is registered and the dispatch table is only
+    # renewed once cached lookups of the new generation see the new lizers.
+    with fork_inst._lock:
+        lizers = dict(getattr(fork_inst, '_{}'.format(kind)))
+        classes = list(getattr(fork_inst, '_classes_{}'.format(kind)))
+        if cls:
+            classes.insert(0 if high_prio else len(classes), cls)
+            cls_name = get_class_name(cls, str.lower, fully_qualified=True)
+        else:
+            cls_name = 'nonetype'
+        lizers[cls_name] = func
+        fork_inst._replace_registry('_{}'.format(kind), lizers)
+        fork_inst._replace_registry('_classes_{}'.format(kind), classes)
+        fork_inst._bump_generation('_{}'.format(kind))
+        fork_inst._replace_registry('_{}_dispatch'.format(kind), dict())
 
 
-@cached
 def get_serializer(
         cls: type,
         fork_inst: Optional[type] = StateHolder) -> callable:
@@ -92,12 +108,16 @@ def get_serializer(
     :param fork_inst: if given, it uses this fork of ``JsonSerializable``.
     :return: a serializer function.
     """
-    serializer = _get_lizer(cls, fork_inst._serializers,
-                            fork_inst._classes_serializers, fork_inst)
-    return serializer
+    # The table is captured, as set_serializer may replace it meanwhile.
+    dispatch = fork_inst._serializers_dispatch
+    try:
+        return dispatch[cls]
+    except KeyError:
+        serializer = _get_lizer(cls, 'serializers', fork_inst)
+        _store(dispatch, cls, serializer)
+        return serializer
 
 
-@cached
 def get_deserializer(
         cls: type,
         fork_inst: Optional[type] = StateHolder) -> callable:
@@ -107,53 +127,103 @@ def get_deserializer(
     :param fork_inst: if given, it uses this fork of ``JsonSerializable``.
     :return: a deserializer function.
     """
-    deserializer = _get_lizer(cls, fork_inst._deserializers,
-                              fork_inst._classes_deserializers, fork_inst)
-    return deserializer
+    # The table is captured, as set_deserializer may replace it meanwhile.
+    dispatch = fork_inst._deserializers_dispatch
+    try:
+        return dispatch[cls]
+    except KeyError:
+        deserializer = _get_lizer(cls, 'deserializers', fork_inst)
+        _store(dispatch, cls, deserializer)
+        return deserializer
+
+
+def _store(dispatch: dict, cls: type, lizer: callable) -> None:
+    # Store the resolved lizer of cls in the dispatch table. The table is
+    # emptied once it is full (e.g. with many dynamically created types).
+    if len(dispatch) >= get_max_size():
+        dispatch.clear()
+    dispatch[cls] = lizer
 
 
 def _get_lizer(
         cls: type,
-        lizers: Dict[str, callable],
-        classes_lizers: list,
+        kind: str,
         fork_inst: type,
         recursive: bool = False) -> callable:
+    # kind is one of 'serializers', 'deserializers' or 'validators'.
+    lizers = getattr(fork_inst, '_{}'.format(kind))
     cls_name = get_class_name(cls, str.lower, fully_qualified=True)
     lizer = (lizers.get(cls_name, None)
-             or _get_lizer_by_parents(cls, lizers, classes_lizers, fork_inst))
+             or _get_lizer_by_parents(cls, kind, fork_inst))
     if not lizer and not recursive and hasattr(cls, '__supertype__'):
-        return _get_lizer(cls.__supertype__, lizers,
-                          classes_lizers, fork_inst, True)
+        return _get_lizer(cls.__supertype__, kind, fork_inst, True)
     return lizer
 
 
 def _get_lizer_by_parents(
         cls: type,
-        lizers: Dict[str, callable],
-        classes_lizers: list,
+        kind: str,
         fork_inst: type) -> callable:
-    result = None
-    parents = _get_parents(cls, classes_lizers)
-    if parents:
-        pname = get_class_name(parents[0], str.lower, fully_qualified=True)
-        result = lizers[pname]
-    return result
-
-
-def _get_parents(cls: type, lizers: list) -> list:
     """
-    Return a list of serializers or deserializers that can handle a parent
-    of ``cls``.
-    :param cls: the type that
-    :param lizers: a list of serializers or deserializers.
-    :return: a list of serializers or deserializers.
+    Return the lizer of the most specific registered parent of ``cls``. The
+    registered parents are looked up along the MRO of ``cls``. Abstract
+    parents (e.g. ``Mapping``) are checked separately, as these need not be
+    in the MRO. If multiple parents are equally specific (e.g. ``str`` and
+    ``Enum`` for ``class E(str, Enum)``), the parent with the highest
+    priority wins.
+    :param cls: the type for which a lizer is to be found.
+    :param kind: 'serializers', 'deserializers' or 'validators'.
+    :param fork_inst: the fork that holds the registrations.
+    :return: a lizer or ``None``.
     """
-    parents = []
     naked_cls = get_naked_class(cls)
-    for cls_ in lizers:
-        try:
-            if issubclass(naked_cls, cls_):
-                parents.append(cls_)
-        except (TypeError, AttributeError):
-            pass  # Some types do not support `issubclass` (e.g. Union).
-    return parents
+    if not isinstance(naked_cls, type):
+        return None  # Some types do not support `issubclass` (e.g. Union).
+    parents_by_cls, abstract_parents = _get_registered_parents(kind,
+                                                               fork_inst)
+    candidates = {parent: parents_by_cls[parent]
+                  for parent in naked_cls.__mro__ if parent in parents_by_cls}
+    for parent, prio_and_lizer in abstract_parents:
+        if parent not in candidates and _is_subclass(naked_cls, parent):
+            candidates[parent] = prio_and_lizer
+    if not candidates:
+        return None
+    most_specific = [parent for parent in candidates
+                     if not any(other is not parent
+                                and _is_subclass(other, parent)
+                                for other in candidates)] or candidates
+    parent = min(most_specific, key=lambda parent_: candidates[parent_][0])
+    return candidates[parent][1]
+
+
+@cached
+def _get_registered_parents(kind: str, fork_inst: type) -> tuple:
+    # Return a dict of all registered (naked) classes with their priority and
+    # lizer, and a tuple of the abstract ones among them. The cache is
+    # invalidated by any registration on fork_inst. The classes are read
+    # before the lizers, as registering a lizer replaces them the other way
+    # around (see _set_lizer).
+    classes = getattr(fork_inst, '_classes_{}'.format(kind))
+    lizers = getattr(fork_inst, '_{}'.format(kind))
+    parents_by_cls = {}
+    abstract_parents = []
+    for prio, cls in enumerate(classes):
+        naked_cls = get_naked_class(cls)
+        if not isinstance(naked_cls, type) or naked_cls in parents_by_cls:
+            continue
+        cls_name = get_class_name(cls, str.lower, fully_qualified=True)
+        prio_and_lizer = (prio, lizers[cls_name])
+        parents_by_cls[naked_cls] = prio_and_lizer
+        if isinstance(naked_cls, ABCMeta):
+            abstract_parents.append((naked_cls, prio_and_lizer))
+    return parents_by_cls, tuple(abstract_parents)
+
+
+def _is_subclass(cls: type, parent: type) -> bool:
+    try:
+        return issubclass(cls, parent)
+    except (TypeError, AttributeError):
+        return False
+
+
+add_clear_hook(StateHolder._reset_dispatch)
@@ -7,19 +7,21 @@ import json
 from json import JSONDecodeError
 from typing import Optional, Dict, Callable, Tuple, Any, Type
 
-from jsons._cache import clear
+from jsons._cache import cached, start_call, end_call
 from jsons._common_impl import (
     StateHolder,
+    JSON_KEYS,
     get_cls_from_str,
     get_class_name,
     get_cls_and_meta,
     determine_precedence,
     VALID_TYPES,
+    META_ATTR,
     T,
     can_match_with_none
 )
 from jsons._lizers_impl import get_deserializer
-from jsons._validation import validate
+from jsons._validation import validate, get_validator
 from jsons.exceptions import DeserializationError, JsonsError, DecodeError
 
 
@@ -73,6 +75,8 @@ def load(
     :param kwargs: the keyword args are passed on to the deserializer function.
     :return: an instance of ``cls`` if given, a dict otherwise.
     """
+    if type(json_obj) is cls and cls in get_trivial_types(fork_inst):
+        return json_obj
     _check_for_none(json_obj, cls)
     if _should_skip(json_obj, cls, strict):
         validate(json_obj, cls, fork_inst)
@@ -98,31 +102,109 @@ def load(
         '_inferred_cls': cls is not original_cls,
     }
 
-    return _do_load(json_obj, deserializer, cls, initial, **kwargs_)
+    if not initial:
+        return _do_load(json_obj, deserializer, cls, **kwargs_)
+    start_call()
+    try:
+        return _do_load(json_obj, deserializer, cls, **kwargs_)
+    finally:
+        # Temporary caches are cleared once the last initial call is done.
+        end_call()
+
+
+def get_loader(
+        cls: type,
+        *,
+        strict: bool = False,
+        fork_inst: Optional[type] = StateHolder,
+        attr_getters: Optional[Dict[str, Callable[[], object]]] = None,
+        **kwargs) -> Callable[[object], object]:
+    """
+    Return a function that loads a single ``json_obj`` into ``cls`` just like
+    ``load(json_obj, cls, ...)`` would with the given arguments. The
+    deserializer of ``cls`` is resolved once, which makes the returned
+    function suitable for loading many values of the same type (e.g. the
+    elements of a ``List[cls]``). Values that need more than that (e.g. values
+    with meta information) are passed on to ``load``.
+    :param cls: the type into which the values are to be loaded.
+    :param strict: a bool to determine if the deserializer should be strict.
+    :param fork_inst: if given, it uses this fork of ``JsonSerializable``.
+    :param attr_getters: a ``dict`` that may hold callables that return values
+    for certain attributes.
+    :param kwargs: the keyword args are passed on to the deserializer function.
+    :return: a function that takes a ``json_obj`` and returns its loaded value.
+    """
+    def _load(json_obj: object) -> object:
+        return load(json_obj, cls, strict=strict, fork_inst=fork_inst,
+                    attr_getters=attr_getters, **kwargs)
+
+    if not cls or isinstance(cls, str) or cls is Any:
+        return _load
+
+    trivial = cls in get_trivial_types(fork_inst)
+    deserializer = get_deserializer(cls, fork_inst)
+    kwargs_ = {
+        'meta_hints': {},  # Overridable by kwargs.
+        **kwargs,
+        'strict': strict,
+        'fork_inst': fork_inst,
+        'attr_getters': attr_getters,
+        '_initial': False,
+        '_inferred_cls': False,
+    }
+
+    def _load_fast(json_obj: object) -> object:
+        type_ = type(json_obj)
+        if type_ is cls and trivial:
+            return json_obj
+        if (json_obj is None
+                or type_ not in VALID_TYPES
+                or (not strict and type_ == cls)
+                or (type_ is dict and META_ATTR in json_obj)):
+            return _load(json_obj)
+        return _do_load(json_obj, deserializer, cls, **kwargs_)
+
+    return _load_fast
 
 
 def _do_load(json_obj: object,
              deserializer: callable,
              cls: type,
-             initial: bool,
              **kwargs):
-    cls_name = get_class_name(cls, fully_qualified=True)
     if deserializer is None:
+        cls_name = get_class_name(cls, fully_qualified=True)
         raise DeserializationError('No deserializer for type "{}"'.format(cls_name), json_obj, cls)
     try:
         result = deserializer(json_obj, cls, **kwargs)
         validate(result, cls, kwargs['fork_inst'])
     except Exception as err:
-        clear()
         if isinstance(err, JsonsError):
             raise
+        cls_name = get_class_name(cls, fully_qualified=True)
         message = 'Could not deserialize value "{}" into "{}". {}'.format(json_obj, cls_name, err)
         raise DeserializationError(message, json_obj, cls) from err
-    else:
-        if initial:
-            # Clear all lru caches right before returning the initial call.
-            clear()
-        return result
+    return result
+
+
+@cached
+def get_trivial_types(fork_inst: type = StateHolder) -> frozenset:
+    """
+    Return the JSON native types (e.g. ``int``) of which values can be loaded
+    as they are by the given fork when the target type is that same type. These
+    are the types without a custom deserializer and without a validator.
+    :param fork_inst: the fork of ``JsonSerializable`` that is used.
+    :return: a set of types.
+    """
+    from jsons.deserializers.default_nonetype import (
+        default_nonetype_deserializer)
+    from jsons.deserializers.default_primitive import (
+        default_primitive_deserializer)
+    from jsons.deserializers.default_string import default_string_deserializer
+    defaults = (default_nonetype_deserializer, default_primitive_deserializer,
+                default_string_deserializer)
+    return frozenset(cls for cls in JSON_KEYS
+                     if get_deserializer(cls, fork_inst) in defaults
+                     and not get_validator(cls, fork_inst))
 
 
 def loads(
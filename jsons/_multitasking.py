@@ -3,13 +3,27 @@ PRIVATE MODULE: do not import (from) it directly.
 
 Functionality for processing iterables in parallel.
 """
-from multiprocessing import Process, Manager
-from typing import List, Callable, Union
+import atexit
+import pickle
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from functools import partial
+from multiprocessing import Manager, Process
+from threading import Lock, Thread
+from typing import List, Callable, Optional, Union
 
 from typish import Something
 
+from jsons._common_impl import StateHolder
+
 Subscriptable = Something['__getitem__': Callable[[int], object]]
 
+_pools = {}  # The persistent pools by task type, size and fork.
+_pools_lock = Lock()
+
 
 def multi_task(
         func: Callable,
@@ -17,14 +31,143 @@ def multi_task(
         tasks: int,
         task_type: type,
         *args,
+        executor: Optional[Executor] = None,
         **kwargs):
+    fork_inst = kwargs.get('fork_inst', StateHolder)
+    executor = get_executor(task_type, tasks, fork_inst, (func, args, kwargs),
+                            executor)
+    if not executor:
+        # Processes that are started for this call only, get the arguments as
+        # they are.
+        return _run_tasks(func, obj, tasks, task_type, args, kwargs)
+
+    # Every task handles a slice of obj and returns its results in one batch.
+    process_slice = partial(_process_slice, func, args, kwargs)
+    result = []
+    for batch in executor.map(process_slice, _get_slices(obj, tasks)):
+        result.extend(batch)
+    return result
+
+
+def get_executor(
+        task_type: type,
+        tasks: int,
+        fork_inst: type,
+        args: tuple,
+        executor: Optional[Executor] = None) -> Optional[Executor]:
+    """
+    Return the executor that runs tasks with the given arguments: the given
+    ``executor``, the executor that was set on ``fork_inst`` or a persistent
+    pool of ``task_type``. Return ``None`` if there is no such executor or if
+    it is a process pool and ``args`` cannot be pickled (e.g. a fork or a
+    lambda), as worker processes of a pool receive their arguments pickled.
+    :param task_type: the type that is used for multitasking.
+    :param tasks: the number of tasks.
+    :param fork_inst: the fork of ``JsonSerializable`` that is used.
+    :param args: all arguments that are sent to the tasks.
+    :param executor: if given, this executor is returned if it can be used.
+    :return: an executor or ``None``.
+    """
+    executor = (executor or fork_inst._executor
+                or _get_pool(task_type, tasks, fork_inst))
+    if (isinstance(executor, ProcessPoolExecutor)
+            and not _is_picklable(args)):
+        return None
+    return executor
+
+
+def shutdown_pools(wait: bool = True):
+    """
+    Shut down the pools of processes and threads that were started for
+    (de)serializing with ``tasks`` greater than 1. New pools are started when
+    needed. This function is called automatically when Python exits.
+    :param wait: if ``True``, wait for the pools to finish their work.
+    :return: None.
+    """
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool, _ in pools:
+        pool.shutdown(wait=wait)
+
+
+def _get_pool(
+        task_type: type,
+        tasks: int,
+        fork_inst: type) -> Optional[Executor]:
+    # Return a persistent pool for the given task type and number of tasks.
+    # Return None if task_type is not Process or Thread itself: a subclass may
+    # customize how its tasks are run, so its instances are started instead.
+    if task_type is Process:
+        # Worker processes hold a copy of the (de)serializers at the time they
+        # were started, so a new pool is needed once these have changed.
+        key = (Process, tasks, fork_inst)
+        pool_type = ProcessPoolExecutor
+    elif task_type is Thread:
+        key = (Thread, tasks, None)
+        pool_type = ThreadPoolExecutor
+    else:
+        return None
+    outdated = None
+    with _pools_lock:
+        pool, generation = _pools.get(key, (None, None))
+        if pool_type is ProcessPoolExecutor and pool:
+            if generation != fork_inst._generation:
+                outdated = pool
+                pool = None
+        if not pool:
+            pool = pool_type(tasks)
+            _pools[key] = (pool, fork_inst._generation)
+    if outdated:
+        outdated.shutdown(wait=False)
+    return pool
+
+
+def _is_picklable(obj: object) -> bool:
+    # Return True if obj can be sent to a worker process of a pool (e.g. a
+    # fork or a lambda cannot).
+    try:
+        pickle.dumps(obj)
+    except Exception:
+        return False
+    return True
+
+
+def _get_slices(obj: Subscriptable, tasks: int) -> List[list]:
+    # Divide obj in at most the given number of slices of (almost) equal size.
+    slices_used = min(tasks, len(obj)) or 1
+    slice_size, rest_size = divmod(len(obj), slices_used)
+    result = []
+    start = 0
+    for i in range(slices_used):
+        end = start + slice_size + (1 if i < rest_size else 0)
+        result.append(obj[start:end])
+        start = end
+    return result
+
+
+def _process_slice(func: Callable, args: tuple, kwargs: dict,
+                   obj_slice: Subscriptable) -> list:
+    # Apply func to all elements of the given slice. Nested iterables are
+    # processed sequentially, as the pool is already occupied.
+    return [func(elem, *args, **{**kwargs, 'tasks': 1}) for elem in obj_slice]
+
+
+def _run_tasks(
+        func: Callable,
+        obj: Subscriptable,
+        tasks: int,
+        task_type: type,
+        args: tuple,
+        kwargs: dict) -> list:
+    # Run func on obj with instances of a task type that has the interface of
+    # Thread (e.g. Process).
     result = _get_list_to_fill(obj, task_type)
     tasks_instances = _start_tasks(tasks=tasks, task_type=task_type, func=func,
                                    list_to_fill=result, obj=obj, args=args,
                                    kwargs=kwargs)
     for task in tasks_instances:
         task.join()
-
     return list(result)
 
 
@@ -80,3 +223,6 @@ def _fill(
     for i_ in range(start, end):
         loaded = func(obj[i_], tasks=tasks, *args, **kwargs)
         list_to_fill[i_] = loaded
+
+
+atexit.register(shutdown_pools)
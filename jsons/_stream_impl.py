@@ -0,0 +1,731 @@
+"""
+PRIVATE MODULE: do not import (from) it directly.
+
+This module contains functionality for streaming json to and from file-like
+objects.
+"""
+import codecs
+import io
+import json
+from json import JSONDecodeError
+from typing import Optional, Dict, Callable, Tuple, Type, Iterator
+
+from typish import get_args, get_origin
+
+from jsons._cache import cached, start_call, end_call
+from jsons._common_impl import StateHolder, T
+from jsons._compatibility_impl import tuple_with_ellipsis
+from jsons._dump_impl import dump, dump_with_serializer, get_native_types
+from jsons._extra_impl import announce_class
+from jsons._lizers_impl import get_serializer, get_deserializer
+from jsons._load_impl import load, get_loader
+from jsons._validation import validate
+from jsons.exceptions import (
+    JsonsError,
+    SerializationError,
+    DeserializationError,
+    DecodeError,
+)
+
+BUFFER_SIZE = 2 ** 16  # The number of characters that is buffered.
+WHITESPACE = ' \t\n\r'
+NUMBER_CHARS = '0123456789+-.eE'  # The characters that may continue a number.
+
+
+def dump_to(obj: object,
+            fp: object,
+            encoding: str = 'utf-8',
+            jdkwargs: Optional[Dict[str, object]] = None,
+            *args,
+            **kwargs) -> None:
+    """
+    Dump the given ``obj`` as JSON to the file-like object ``fp``, which can
+    be a text or binary stream. Unlike ``dumps``, the JSON is written while
+    ``obj`` is being serialized: lists, tuples, sets, other iterables and
+    dicts that are serialized by the default serializers are written element
+    by element, without building their JSON equivalent in memory first. Any
+    other value (e.g. an object) is dumped as a whole before it is written.
+
+    If the serialization fails, ``fp`` may hold partially written JSON.
+
+    :param obj: the object that is to be dumped.
+    :param fp: a file-like object with a ``write`` method.
+    :param encoding: the encoding that is used for binary streams.
+    :param jdkwargs: extra keyword arguments for ``json.dump`` (not
+    ``jsons.dump``!)
+    :param args: extra arguments for ``jsons.dump``.
+    :param kwargs: Keyword arguments that are passed on through the
+    serialization process.
+    :return: None.
+    """
+    start_call()
+    try:
+        _stream(fp, encoding, jdkwargs or {}, obj, *args, **kwargs)
+    finally:
+        end_call()
+
+
+def _stream(fp: object,
+            encoding: str,
+            jdkwargs: Dict[str, object],
+            obj: object,
+            cls: Optional[type] = None,
+            *,
+            strict: bool = False,
+            fork_inst: Optional[type] = StateHolder,
+            **kwargs) -> None:
+    writer = _Writer(fp, encoding, jdkwargs, fork_inst)
+    kwargs_ = {
+        **kwargs,
+        'fork_inst': fork_inst,
+        'strict': strict,
+        '_initial': False,
+    }
+    if kwargs.get('verbose'):
+        # Meta information can only be added to a fully serialized object.
+        writer.write_value(dump(obj, cls, **kwargs_), 0)
+    else:
+        _write(writer, obj, cls, 0, kwargs_)
+    writer.flush()
+
+
+def _write(writer: '_Writer',
+           obj: object,
+           cls: Optional[type],
+           level: int,
+           kwargs: dict) -> None:
+    # Write the JSON equivalent of obj, like dump(obj, cls, **kwargs) would
+    # produce it.
+    cls_ = cls or obj.__class__
+    if cls_ is obj.__class__ and cls_ in writer.native_types:
+        writer.write_value(obj, level)
+        return
+    serializer = get_serializer(cls_, writer.fork_inst)
+    streamer = writer.streamers.get(serializer)
+    if streamer and not (streamer is _write_dict and writer.sort_keys):
+        try:
+            streamer(writer, obj, cls, level, **kwargs)
+        except JsonsError:
+            raise
+        except Exception as err:
+            raise SerializationError(str(err)) from err
+    else:
+        writer.write_value(dump(obj, cls, **kwargs), level)
+
+
+def _write_list(writer: '_Writer',
+                obj: list,
+                cls: Optional[type],
+                level: int,
+                *,
+                strict: bool = False,
+                **kwargs) -> None:
+    # See default_list_serializer.
+    kwargs_ = {**kwargs, 'strict': strict}
+    kwargs_.pop('_store_cls', None)
+    inner_type = None
+    cls_args = get_args(cls)
+    if cls_args:
+        inner_type = cls_args[0]
+    elif strict and obj:
+        inner_type = type(obj[0])
+    writer.write_list((_writer_of(writer, elem, inner_type, kwargs_)
+                       for elem in obj), level)
+
+
+def _write_tuple(writer: '_Writer',
+                 obj: tuple,
+                 cls: Optional[type],
+                 level: int,
+                 **kwargs) -> None:
+    # See default_tuple_serializer.
+    if hasattr(obj, '_fields'):
+        writer.write_value(dump(obj, cls, **kwargs), level)
+        return
+    cls_ = cls
+    if cls and tuple_with_ellipsis(cls):
+        cls_ = Tuple[(get_args(cls)[0],) * len(obj)]
+    _write_iterable(writer, obj, cls_, level, **kwargs)
+
+
+def _write_iterable(writer: '_Writer',
+                    obj: object,
+                    cls: Optional[type],
+                    level: int,
+                    *,
+                    strict: bool = False,
+                    tasks: int = 1,
+                    **kwargs) -> None:
+    # See default_iterable_serializer.
+    from jsons.serializers.default_iterable import (
+        _determine_cls,
+        _get_subclasses,
+    )
+    if tasks > 1:
+        writer.write_value(dump(obj, cls, strict=strict, tasks=tasks,
+                                **kwargs), level)
+        return
+    kwargs_ = {**kwargs, 'strict': strict}
+    kwargs_.pop('_store_cls', None)
+    if strict:
+        subclasses = _get_subclasses(obj, _determine_cls(obj, cls))
+    else:
+        subclasses = _get_subclasses(obj, None)
+    writer.write_list((_writer_of(writer, elem, subclasses[i], kwargs_)
+                       for i, elem in enumerate(obj)), level)
+
+
+def _write_dict(writer: '_Writer',
+                obj: dict,
+                cls: Optional[type],
+                level: int,
+                *,
+                strict: bool = False,
+                strip_nulls: bool = False,
+                key_transformer: Optional[Callable[[str], str]] = None,
+                types: Optional[Dict[str, type]] = None,
+                **kwargs) -> None:
+    # See default_dict_serializer. Hashed keys are written last.
+    from jsons.serializers.default_dict import _store_and_hash
+    types = types or dict()
+    hashed_keys = {}
+    kwargs_ = {
+        'key_transformer': key_transformer,
+        'strip_nulls': strip_nulls,
+        'strict': strict,
+        **kwargs
+    }
+
+    def _items():
+        for key in obj:
+            obj_ = obj[key]
+            cls_ = types.get(key, None)
+            dict_and_key = _store_and_hash({}, key, types=types, **kwargs_)
+            if dict_and_key:
+                keys, key = dict_and_key
+                hashed_keys.update(keys.get('-keys', {}))
+            if key_transformer:
+                key = key_transformer(key)
+            yield key, _writer_of(writer, obj_, cls_, kwargs_, strip_nulls)
+        if hashed_keys:
+            yield '-keys', _value_writer(writer, hashed_keys)
+
+    writer.write_dict(_items(), level)
+
+
+def _writer_of(
+        writer: '_Writer',
+        obj: object,
+        cls: Optional[type],
+        kwargs: dict,
+        strip_nulls: bool = False) -> Optional[Callable[[int], None]]:
+    # Return a function that writes obj at a given level. Return None if obj
+    # is to be omitted.
+    cls_ = cls or obj.__class__
+    if cls_ is obj.__class__ and cls_ in writer.native_types:
+        dumped = obj
+    else:
+        serializer = get_serializer(cls_, writer.fork_inst)
+        if serializer in writer.streamers:
+            return lambda level: _write(writer, obj, cls, level, kwargs)
+        # This is what dump does, but the class is announced only once.
+        if cls_ not in writer.announced:
+            announce_class(cls_, fork_inst=writer.fork_inst)
+            writer.announced.add(cls_)
+        dumped = dump_with_serializer(obj, serializer, cls, kwargs)
+    if strip_nulls and dumped is None:
+        return None
+    return _value_writer(writer, dumped)
+
+
+def _value_writer(
+        writer: '_Writer',
+        dumped: object) -> Callable[[int], None]:
+    return lambda level: writer.write_value(dumped, level)
+
+
+@cached
+def _get_streamers() -> Dict[callable, callable]:
+    # Return the default serializers of which the results can be streamed,
+    # with their streaming equivalents.
+    from jsons.serializers.default_dict import default_dict_serializer
+    from jsons.serializers.default_iterable import default_iterable_serializer
+    from jsons.serializers.default_list import default_list_serializer
+    from jsons.serializers.default_tuple import default_tuple_serializer
+    return {
+        default_list_serializer: _write_list,
+        default_tuple_serializer: _write_tuple,
+        default_iterable_serializer: _write_iterable,
+        default_dict_serializer: _write_dict,
+    }
+
+
+class _Writer:
+    """
+    Writes JSON tokens to a text or binary stream in buffered chunks,
+    formatted the same way as ``json.dumps`` would with the same arguments.
+    """
+    def __init__(self,
+                 fp: object,
+                 encoding: str,
+                 jdkwargs: dict,
+                 fork_inst: type):
+        jdkwargs = {**jdkwargs}
+        encoder_cls = jdkwargs.pop('cls', None) or json.JSONEncoder
+        self.encoder = encoder_cls(**jdkwargs)
+        self.sort_keys = self.encoder.sort_keys
+        indent = self.encoder.indent
+        if isinstance(indent, int):
+            indent = ' ' * indent
+        self.indent = indent
+        self.fp = fp
+        self.binary = _is_binary(fp)
+        self.encoding = encoding
+        self.buffer = []
+        self.buffered = 0
+        self.fork_inst = fork_inst
+        self.native_types = get_native_types(fork_inst)
+        self.streamers = _get_streamers()
+        self.announced = set()
+
+    def write(self, chunk: str) -> None:
+        self.buffer.append(chunk)
+        self.buffered += len(chunk)
+        if self.buffered >= BUFFER_SIZE:
+            self.flush()
+
+    def flush(self) -> None:
+        chunk = ''.join(self.buffer)
+        self.buffer = []
+        self.buffered = 0
+        if chunk:
+            self.fp.write(chunk.encode(self.encoding) if self.binary
+                          else chunk)
+
+    def write_value(self, value: object, level: int) -> None:
+        # Write a fully serialized value.
+        chunk = self.encoder.encode(value)
+        newline = self._newline(level)
+        if newline and '\n' in chunk:
+            # Strings in JSON cannot contain a bare newline character.
+            chunk = chunk.replace('\n', newline)
+        self.write(chunk)
+
+    def write_list(self, writers, level: int) -> None:
+        self._write_container('[', ']', writers, level)
+
+    def write_dict(self, items, level: int) -> None:
+        key_separator = self.encoder.key_separator
+
+        def _writers():
+            for key, writer in items:
+                if writer:
+                    yield self._item_writer(key, key_separator, writer)
+
+        self._write_container('{', '}', _writers(), level)
+
+    def _item_writer(self, key, key_separator, writer):
+        def _write_item(level: int) -> None:
+            self.write(self._key_to_str(key))
+            self.write(key_separator)
+            writer(level)
+        return _write_item
+
+    def _write_container(self, start: str, end: str, writers,
+                         level: int) -> None:
+        inner_newline = self._newline(level + 1) or ''
+        separator = self.encoder.item_separator + inner_newline
+        first = True
+        for writer in writers:
+            self.write(start + inner_newline if first else separator)
+            first = False
+            writer(level + 1)
+        if first:
+            self.write(start)
+        else:
+            self.write(self._newline(level) or '')
+        self.write(end)
+
+    def _newline(self, level: int) -> Optional[str]:
+        if self.indent is None:
+            return None
+        return '\n' + self.indent * level
+
+    def _key_to_str(self, key: object) -> str:
+        # Convert a key the same way json.dumps would.
+        if isinstance(key, str):
+            pass
+        elif key is True:
+            key = 'true'
+        elif key is False:
+            key = 'false'
+        elif key is None:
+            key = 'null'
+        elif isinstance(key, (int, float)):
+            key = self.encoder.encode(key)
+        else:
+            raise TypeError('keys must be str, int, float, bool or None, '
+                            'not {}'.format(key.__class__.__name__))
+        return self.encoder.encode(key)
+
+
+def _is_binary(fp: object) -> bool:
+    if isinstance(fp, io.TextIOBase):
+        return False
+    if isinstance(fp, (io.RawIOBase, io.BufferedIOBase)):
+        return True
+    return 'b' in getattr(fp, 'mode', '')
+
+
+def load_from(fp: object,
+              cls: Optional[Type[T]] = None,
+              encoding: str = 'utf-8',
+              jdkwargs: Optional[Dict[str, object]] = None,
+              *args,
+              **kwargs) -> T:
+    """
+    Load the JSON from the file-like object ``fp``, which can be a text or
+    binary stream, into a dict or a Python instance of type ``cls``. Unlike
+    ``loads``, the JSON is read and parsed in chunks. If the JSON is an array
+    that is to be loaded by the default list deserializer (e.g. into
+    ``List[Person]``), every element is deserialized as soon as it is read.
+    The same goes for the values of an object that is to be loaded by the
+    default dict or mapping deserializer (e.g. into ``Dict[str, Person]``).
+    The generic list or dict of the entire JSON is thus never built in memory.
+    Any other value is read entirely before it is loaded.
+
+    Meta information that is stored at the top level of a streamed object is
+    not taken into account. Use ``loads`` for objects that were dumped with
+    ``verbose=True``.
+
+    :param fp: a file-like object with a ``read`` method.
+    :param cls: a matching class of which an instance should be returned.
+    :param encoding: the encoding that is used for binary streams.
+    :param jdkwargs: extra keyword arguments for ``json.JSONDecoder`` (not
+    ``jsons.load``!)
+    :param args: extra arguments for ``jsons.load``.
+    :param kwargs: extra keyword arguments for ``jsons.load``.
+    :return: a JSON-type object (dict, str, list, etc.) or an instance of type
+    ``cls`` if given.
+    """
+    start_call()
+    try:
+        reader = _Reader(fp, cls, encoding, jdkwargs or {})
+        return _load_streamed(reader, cls, *args, **kwargs)
+    finally:
+        end_call()
+
+
+def iter_load(fp: object,
+              cls: Optional[Type[T]] = None,
+              encoding: str = 'utf-8',
+              jdkwargs: Optional[Dict[str, object]] = None,
+              *args,
+              **kwargs) -> Iterator[T]:
+    """
+    Return a generator that loads the elements of the JSON array in the
+    file-like object ``fp`` one by one. Every element is read and loaded into
+    an instance of type ``cls`` (if given) when the generator reaches it. The
+    elements that were already yielded are not kept, so a large array can be
+    processed with a constant amount of memory.
+
+    The JSON in ``fp`` must be an array. If it turns out to be invalid JSON
+    halfway, a ``DecodeError`` is raised after the elements before that point
+    have been yielded.
+
+    :param fp: a file-like object with a ``read`` method.
+    :param cls: the class of the elements of the array.
+    :param encoding: the encoding that is used for binary streams.
+    :param jdkwargs: extra keyword arguments for ``json.JSONDecoder`` (not
+    ``jsons.load``!)
+    :param args: extra arguments for ``jsons.load``.
+    :param kwargs: extra keyword arguments for ``jsons.load``.
+    :return: a generator of JSON-type objects or instances of type ``cls``.
+    """
+    reader = _Reader(fp, cls, encoding, jdkwargs or {})
+    return _iter_streamed(reader, cls, *args, **kwargs)
+
+
+def _iter_streamed(reader: '_Reader',
+                   cls: Optional[type],
+                   *,
+                   strict: bool = False,
+                   fork_inst: Optional[type] = StateHolder,
+                   attr_getters: Optional[Dict[str, Callable[[], object]]]
+                   = None,
+                   **kwargs) -> Iterator:
+    kwargs_ = _get_load_kwargs(kwargs, strict, fork_inst, attr_getters)
+    start_call()
+    try:
+        yield from _iter_elements(reader.read_elements(), cls, **kwargs_)
+        reader.read_end()
+    finally:
+        end_call()
+
+
+def _load_streamed(reader: '_Reader',
+                   cls: Optional[type],
+                   *,
+                   strict: bool = False,
+                   fork_inst: Optional[type] = StateHolder,
+                   attr_getters: Optional[Dict[str, Callable[[], object]]]
+                   = None,
+                   **kwargs) -> object:
+    from jsons.deserializers.default_dict import default_dict_deserializer
+    from jsons.deserializers.default_list import default_list_deserializer
+    from jsons.deserializers.default_mapping import (
+        default_mapping_deserializer)
+    start = reader.peek()
+    cls_ = cls
+    if cls is None and start == '[':
+        # Objects without cls are not streamed as they may hold meta data.
+        cls_ = list
+    deserializer = None
+    if (cls_ is not None
+            and not isinstance(cls_, str)
+            and kwargs.get('tasks', 1) == 1
+            and (strict or cls not in (list, dict))):
+        deserializer = get_deserializer(cls_, fork_inst)
+    kwargs_ = _get_load_kwargs(kwargs, strict, fork_inst, attr_getters)
+
+    if start == '[' and deserializer is default_list_deserializer:
+        result = _load_list(reader.read_elements(), cls_, **kwargs_)
+    elif (start == '{' and reader.plain_objects
+          and deserializer in (default_dict_deserializer,
+                               default_mapping_deserializer)):
+        result = _load_dict(reader.read_items(), cls_, **kwargs_)
+        origin = get_origin(cls_)
+        if (deserializer is default_mapping_deserializer
+                and not isinstance(result, origin)):
+            result = cls_(result)
+    else:
+        json_obj = reader.read_value()
+        reader.read_end()
+        return load(json_obj, cls, strict=strict, fork_inst=fork_inst,
+                    attr_getters=attr_getters, **kwargs)
+
+    reader.read_end()
+    validate(result, cls_, fork_inst)
+    return result
+
+
+def _load_list(elems: Iterator, cls: type, **kwargs) -> list:
+    # See default_list_deserializer.
+    cls_args = get_args(cls)
+    return list(_iter_elements(elems, cls_args[0] if cls_args else None,
+                               **kwargs))
+
+
+def _iter_elements(elems: Iterator,
+                   cls: Optional[type],
+                   *,
+                   warn_on_fail: bool = False,
+                   fork_inst: Type[StateHolder] = StateHolder,
+                   tasks: int = 1,
+                   task_type: Optional[type] = None,
+                   **kwargs) -> Iterator:
+    # Yield the elements of a list as they are loaded into cls.
+    from jsons.deserializers.default_list import _iter_load
+    kwargs_ = {**kwargs}
+    if cls:
+        # Mark the cls as 'inferred', see default_list_deserializer.
+        kwargs_['_inferred_cls'] = True
+    return _iter_load(elems, cls, warn_on_fail, fork_inst, kwargs_)
+
+
+def _get_load_kwargs(
+        kwargs: dict,
+        strict: bool,
+        fork_inst: type,
+        attr_getters: Optional[Dict[str, Callable[[], object]]]) -> dict:
+    # Return the kwargs that load would pass on to a deserializer.
+    return {
+        'meta_hints': {},  # Overridable by kwargs.
+        **kwargs,
+        'strict': strict,
+        'fork_inst': fork_inst,
+        'attr_getters': attr_getters,
+        '_initial': False,
+        '_inferred_cls': False,
+    }
+
+
+def _load_dict(items: Iterator,
+               cls: type,
+               *,
+               key_transformer: Optional[Callable[[str], str]] = None,
+               **kwargs) -> dict:
+    # See default_dict_deserializer. The values are loaded as they are read,
+    # the keys are loaded once it is known whether they were hashed.
+    cls_args = get_args(cls)
+    key_transformer_ = key_transformer or (lambda key: key)
+    kwargs_ = {**kwargs, 'key_transformer': key_transformer_}
+    cls_k = cls_v = None
+    if len(cls_args) == 2:
+        cls_k, cls_v = cls_args
+    loader = get_loader(cls_v, **kwargs_)
+    stored_keys = {}
+    loaded = []
+    for key, value in items:
+        if key == '-keys':
+            stored_keys = value
+        else:
+            loaded.append((key, loader(value)))
+
+    if stored_keys and not cls_k:
+        raise DeserializationError('A detailed type is needed for cls of the '
+                                   'form Dict[<type>, <type>] to deserialize '
+                                   'a dict with hashed keys.', None, cls)
+    kwargs_k = {**kwargs, 'key_transformer': key_transformer, 'cls': cls_k}
+    if stored_keys:
+        key_func = key_transformer_
+    elif cls_k:
+        key_func = lambda key: load(key_transformer_(key), **kwargs_k)
+    else:
+        key_func = key_transformer_
+    result = {}
+    hashed = []
+    for key, value in loaded:
+        if key in stored_keys:
+            hashed.append((load(stored_keys[key], **kwargs_k), value))
+        else:
+            result[key_func(key)] = value
+    # Like with default_dict_deserializer, the hashed keys come last.
+    result.update(hashed)
+    return result
+
+
+class _Reader:
+    """
+    Reads JSON values from a text or binary stream in buffered chunks. Only
+    the part of the stream that has not been parsed yet is held in memory.
+    """
+    def __init__(self,
+                 fp: object,
+                 cls: Optional[type],
+                 encoding: str,
+                 jdkwargs: dict):
+        jdkwargs = {**jdkwargs}
+        decoder_cls = jdkwargs.pop('cls', None) or json.JSONDecoder
+        self.decoder = decoder_cls(**jdkwargs)
+        # Objects that are to be transformed by a hook cannot be streamed.
+        self.plain_objects = not (self.decoder.object_hook
+                                  or self.decoder.object_pairs_hook)
+        self.fp = fp
+        self.cls = cls
+        self.encoding = encoding
+        self.text_decoder = None
+        if _is_binary(fp):
+            self.text_decoder = codecs.getincrementaldecoder(encoding)()
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+        self.chunk_size = BUFFER_SIZE
+
+    def peek(self) -> str:
+        # Skip any whitespace and return the next character without consuming
+        # it. Return an empty string at the end of the stream.
+        while True:
+            buffer = self.buffer
+            pos = self.pos
+            while pos < len(buffer) and buffer[pos] in WHITESPACE:
+                pos += 1
+            self.pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if not self._fill():
+                return ''
+
+    def read_value(self) -> object:
+        self.peek()
+        while True:
+            try:
+                obj, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except JSONDecodeError as err:
+                # The value may be incomplete; try again with more data.
+                if not self._fill():
+                    raise self._error(err)
+                continue
+            if self._may_continue(end) and self._fill():
+                # A number may continue in the next chunk.
+                continue
+            self.pos = end
+            self.chunk_size = BUFFER_SIZE
+            return obj
+
+    def read_elements(self) -> Iterator[object]:
+        # Yield the raw values of an array one by one.
+        self._read_char('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        while True:
+            yield self.read_value()
+            if self._read_char(',]', 'Expecting \',\' delimiter') == ']':
+                return
+
+    def read_items(self) -> Iterator[Tuple[str, object]]:
+        # Yield the keys and raw values of an object one by one.
+        self._read_char('{')
+        if self.peek() == '}':
+            self.pos += 1
+            return
+        while True:
+            if self.peek() != '"':
+                raise self._error('Expecting property name enclosed in '
+                                  'double quotes')
+            key = self.read_value()
+            self._read_char(':', 'Expecting \':\' delimiter')
+            yield key, self.read_value()
+            if self._read_char(',}', 'Expecting \',\' delimiter') == '}':
+                return
+
+    def read_end(self) -> None:
+        if self.peek():
+            raise self._error('Extra data')
+
+    def _read_char(self, expected: str, msg: str = None) -> str:
+        char = self.peek()
+        if not char or char not in expected:
+            raise self._error(msg or 'Expecting \'{}\''.format(expected))
+        self.pos += 1
+        return char
+
+    def _may_continue(self, end: int) -> bool:
+        # Return True if the value that was decoded up to end is a number
+        # that may continue beyond the buffer (e.g. '11.' of '11.5').
+        buffer = self.buffer
+        if buffer[self.pos] not in NUMBER_CHARS:
+            return False
+        while end < len(buffer) and buffer[end] in NUMBER_CHARS:
+            end += 1
+        return end == len(buffer)
+
+    def _fill(self) -> bool:
+        # Append the next chunk to the unparsed part of the buffer. Return
+        # False at the end of the stream.
+        if self.eof:
+            return False
+        chunk = self.fp.read(self.chunk_size)
+        # The chunks grow for values that span multiple chunks, to prevent
+        # these from being parsed over and over.
+        self.chunk_size *= 2
+        self.eof = not chunk
+        if self.text_decoder:
+            try:
+                chunk = self.text_decoder.decode(chunk, final=self.eof)
+            except UnicodeDecodeError as err:
+                raise DeserializationError(
+                    'Could not load a value; the given stream could not be '
+                    'decoded using "{}".'.format(self.encoding),
+                    self.fp, self.cls) from err
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return not self.eof
+
+    def _error(self, err: object) -> DecodeError:
+        if not isinstance(err, JSONDecodeError):
+            err = JSONDecodeError(err, self.buffer, self.pos)
+        return DecodeError('Could not load a value; the given stream does '
+                           'not contain valid JSON. {}'.format(err.msg),
+                           self.fp, self.cls, err)
@@ -30,9 +30,13 @@ def set_validator(
         for cls_ in cls:
             set_validator(func, cls=cls_, fork_inst=fork_inst)
     else:
-        cls_name = get_class_name(cls, fully_qualified=True)
-        fork_inst._validators[cls_name.lower()] = func
-        fork_inst._classes_validators.append(cls)
+        cls_name = get_class_name(cls, str.lower, fully_qualified=True)
+        with fork_inst._lock:
+            validators = {**fork_inst._validators, cls_name: func}
+            classes = fork_inst._classes_validators + [cls]
+            fork_inst._replace_registry('_validators', validators)
+            fork_inst._replace_registry('_classes_validators', classes)
+            fork_inst._bump_generation('_validators')
 
 
 @cached
@@ -45,8 +49,7 @@ def get_validator(
     :param fork_inst: if given, it uses this fork of ``JsonSerializable``.
     :return: a validator function.
     """
-    return _get_lizer(cls, fork_inst._validators,
-                      fork_inst._classes_validators, fork_inst)
+    return _get_lizer(cls, 'validators', fork_inst)
 
 
 def validate(
@@ -0,0 +1,421 @@
+"""
+This module contains coroutine versions of the main functions of `jsons`.
+
+Small payloads are (de)serialized right away on the event loop. Payloads of
+at least a threshold size are (de)serialized on an executor, such that other
+coroutines can run meanwhile. The size of a payload is estimated: it is the
+length of a string or bytes and ``ELEMENT_SIZE`` per element of a list,
+tuple, set or dict or per attribute of an object, plus the sizes of these
+elements and attributes. At most ``MAX_NODES`` objects are visited.
+
+As an alternative to offloading, lists and dicts can be deserialized on the
+event loop with the coroutine versions of ``default_list_deserializer`` and
+``default_dict_deserializer``. These let other coroutines run every
+``yield_every`` elements.
+"""
+import asyncio
+import io
+from concurrent.futures import Executor
+from functools import partial
+from typing import Optional, Dict, Callable, Type, Iterator
+
+from typish import get_args
+
+import jsons
+from jsons._common_impl import StateHolder, T
+from jsons._load_impl import get_trivial_types
+from jsons.deserializers.default_dict import (
+    _load_hashed_keys,
+    _iter_deserialize,
+)
+from jsons.deserializers.default_list import (
+    _get_elem_cls_and_kwargs,
+    _iter_load,
+    _load_trivial,
+)
+from jsons.exceptions import JsonsError
+
+# Python3.7+: get_running_loop is preferred within coroutines.
+_get_running_loop = getattr(asyncio, 'get_running_loop',
+                            asyncio.get_event_loop)
+
+THRESHOLD = 2 ** 16  # The default size from which payloads are offloaded.
+ELEMENT_SIZE = 64  # The estimated size of an element of a sized object.
+MAX_NODES = 1000  # The maximum number of objects visited to estimate a size.
+YIELD_EVERY = 100  # The default number of elements between two yields.
+
+_executor = None  # The executor for large payloads, the loop's if None.
+_threshold = THRESHOLD
+
+
+async def dump(obj: object,
+               *args,
+               offload_to: Optional[Executor] = None,
+               threshold: Optional[int] = None,
+               **kwargs) -> object:
+    """
+    Coroutine version of ``jsons.dump``.
+    :param obj: a Python instance of any sort.
+    :param args: extra arguments for ``jsons.dump``.
+    :param offload_to: the executor for a large ``obj``, if not the one that
+    is set with ``set_executor``.
+    :param threshold: the size from which ``obj`` is offloaded, if not the one
+    that is set with ``set_threshold``.
+    :param kwargs: extra keyword arguments for ``jsons.dump``.
+    :return: the serialized obj as a JSON type.
+    """
+    size = _get_size(obj, threshold)
+    return await _run(jsons.dump, size, offload_to, threshold,
+                      (obj, *args), kwargs)
+
+
+async def dumps(obj: object,
+                jdkwargs: Optional[Dict[str, object]] = None,
+                *args,
+                offload_to: Optional[Executor] = None,
+                threshold: Optional[int] = None,
+                **kwargs) -> str:
+    """
+    Coroutine version of ``jsons.dumps``.
+    :param obj: the object that is to be dumped to a string.
+    :param jdkwargs: extra keyword arguments for ``json.dumps`` (not
+    ``jsons.dumps``!)
+    :param args: extra arguments for ``jsons.dumps``.
+    :param offload_to: the executor for a large ``obj``, if not the one that
+    is set with ``set_executor``.
+    :param threshold: the size from which ``obj`` is offloaded, if not the one
+    that is set with ``set_threshold``.
+    :param kwargs: extra keyword arguments for ``jsons.dumps``.
+    :return: ``obj`` as a ``str``.
+    """
+    size = _get_size(obj, threshold)
+    return await _run(jsons.dumps, size, offload_to, threshold,
+                      (obj, jdkwargs, *args), kwargs)
+
+
+async def dumpb(obj: object,
+                encoding: str = 'utf-8',
+                jdkwargs: Optional[Dict[str, object]] = None,
+                *args,
+                offload_to: Optional[Executor] = None,
+                threshold: Optional[int] = None,
+                **kwargs) -> bytes:
+    """
+    Coroutine version of ``jsons.dumpb``.
+    :param obj: the object that is to be dumped to bytes.
+    :param encoding: the encoding that is used to transform to bytes.
+    :param jdkwargs: extra keyword arguments for ``json.dumps`` (not
+    ``jsons.dumps``!)
+    :param args: extra arguments for ``jsons.dumpb``.
+    :param offload_to: the executor for a large ``obj``, if not the one that
+    is set with ``set_executor``.
+    :param threshold: the size from which ``obj`` is offloaded, if not the one
+    that is set with ``set_threshold``.
+    :param kwargs: extra keyword arguments for ``jsons.dumpb``.
+    :return: ``obj`` as ``bytes``.
+    """
+    size = _get_size(obj, threshold)
+    return await _run(jsons.dumpb, size, offload_to, threshold,
+                      (obj, encoding, jdkwargs, *args), kwargs)
+
+
+async def dump_to(obj: object,
+                  fp: object,
+                  encoding: str = 'utf-8',
+                  jdkwargs: Optional[Dict[str, object]] = None,
+                  *args,
+                  offload_to: Optional[Executor] = None,
+                  threshold: Optional[int] = None,
+                  **kwargs) -> None:
+    """
+    Coroutine version of ``jsons.dump_to``.
+    :param obj: the object that is to be dumped.
+    :param fp: a file-like object with a ``write`` method.
+    :param encoding: the encoding that is used for binary streams.
+    :param jdkwargs: extra keyword arguments for ``json.dump`` (not
+    ``jsons.dump``!)
+    :param args: extra arguments for ``jsons.dump_to``.
+    :param offload_to: the executor for a large ``obj``, if not the one that
+    is set with ``set_executor``.
+    :param threshold: the size from which ``obj`` is offloaded, if not the one
+    that is set with ``set_threshold``.
+    :param kwargs: extra keyword arguments for ``jsons.dump_to``.
+    :return: None.
+    """
+    size = _get_size(obj, threshold)
+    return await _run(jsons.dump_to, size, offload_to, threshold,
+                      (obj, fp, encoding, jdkwargs, *args), kwargs)
+
+
+async def load(json_obj: object,
+               cls: Optional[Type[T]] = None,
+               *args,
+               offload_to: Optional[Executor] = None,
+               threshold: Optional[int] = None,
+               **kwargs) -> T:
+    """
+    Coroutine version of ``jsons.load``.
+    :param json_obj: the dict that is to be deserialized.
+    :param cls: a matching class of which an instance should be returned.
+    :param args: extra arguments for ``jsons.load``.
+    :param offload_to: the executor for a large ``json_obj``, if not the one
+    that is set with ``set_executor``.
+    :param threshold: the size from which ``json_obj`` is offloaded, if not
+    the one that is set with ``set_threshold``.
+    :param kwargs: extra keyword arguments for ``jsons.load``.
+    :return: an instance of ``cls`` if given, a dict otherwise.
+    """
+    size = _get_size(json_obj, threshold)
+    return await _run(jsons.load, size, offload_to, threshold,
+                      (json_obj, cls, *args), kwargs)
+
+
+async def loads(str_: str,
+                cls: Optional[Type[T]] = None,
+                jdkwargs: Optional[Dict[str, object]] = None,
+                *args,
+                offload_to: Optional[Executor] = None,
+                threshold: Optional[int] = None,
+                **kwargs) -> T:
+    """
+    Coroutine version of ``jsons.loads``.
+    :param str_: the string that is to be loaded.
+    :param cls: a matching class of which an instance should be returned.
+    :param jdkwargs: extra keyword arguments for ``json.loads`` (not
+    ``jsons.loads``!)
+    :param args: extra arguments for ``jsons.loads``.
+    :param offload_to: the executor for a large ``str_``, if not the one that
+    is set with ``set_executor``.
+    :param threshold: the size from which ``str_`` is offloaded, if not the
+    one that is set with ``set_threshold``.
+    :param kwargs: extra keyword arguments for ``jsons.loads``.
+    :return: a JSON-type object (dict, str, list, etc.) or an instance of type
+    ``cls`` if given.
+    """
+    size = _get_size(str_, threshold)
+    return await _run(jsons.loads, size, offload_to, threshold,
+                      (str_, cls, jdkwargs, *args), kwargs)
+
+
+async def loadb(bytes_: bytes,
+                cls: Optional[Type[T]] = None,
+                encoding: str = 'utf-8',
+                jdkwargs: Optional[Dict[str, object]] = None,
+                *args,
+                offload_to: Optional[Executor] = None,
+                threshold: Optional[int] = None,
+                **kwargs) -> T:
+    """
+    Coroutine version of ``jsons.loadb``.
+    :param bytes_: the bytes that are to be loaded.
+    :param cls: a matching class of which an instance should be returned.
+    :param encoding: the encoding that is used to transform from bytes.
+    :param jdkwargs: extra keyword arguments for ``json.loads`` (not
+    ``jsons.loads``!)
+    :param args: extra arguments for ``jsons.loadb``.
+    :param offload_to: the executor for a large ``bytes_``, if not the one
+    that is set with ``set_executor``.
+    :param threshold: the size from which ``bytes_`` is offloaded, if not the
+    one that is set with ``set_threshold``.
+    :param kwargs: extra keyword arguments for ``jsons.loadb``.
+    :return: a JSON-type object (dict, str, list, etc.) or an instance of type
+    ``cls`` if given.
+    """
+    size = _get_size(bytes_, threshold)
+    return await _run(jsons.loadb, size, offload_to, threshold,
+                      (bytes_, cls, encoding, jdkwargs, *args), kwargs)
+
+
+async def load_from(fp: object,
+                    cls: Optional[Type[T]] = None,
+                    encoding: str = 'utf-8',
+                    jdkwargs: Optional[Dict[str, object]] = None,
+                    *args,
+                    offload_to: Optional[Executor] = None,
+                    threshold: Optional[int] = None,
+                    **kwargs) -> T:
+    """
+    Coroutine version of ``jsons.load_from``. The size of the payload is the
+    number of characters or bytes that are left in ``fp``. If ``fp`` is not
+    seekable, its size is unknown and it is always offloaded.
+    :param fp: a file-like object with a ``read`` method.
+    :param cls: a matching class of which an instance should be returned.
+    :param encoding: the encoding that is used for binary streams.
+    :param jdkwargs: extra keyword arguments for ``json.JSONDecoder`` (not
+    ``jsons.load``!)
+    :param args: extra arguments for ``jsons.load_from``.
+    :param offload_to: the executor for a large ``fp``, if not the one that
+    is set with ``set_executor``.
+    :param threshold: the size from which ``fp`` is offloaded, if not the one
+    that is set with ``set_threshold``.
+    :param kwargs: extra keyword arguments for ``jsons.load_from``.
+    :return: a JSON-type object (dict, str, list, etc.) or an instance of type
+    ``cls`` if given.
+    """
+    size = _get_stream_size(fp)
+    return await _run(jsons.load_from, size, offload_to, threshold,
+                      (fp, cls, encoding, jdkwargs, *args), kwargs)
+
+
+async def default_list_deserializer(
+        obj: list,
+        cls: type = None,
+        *,
+        warn_on_fail: bool = False,
+        yield_every: int = YIELD_EVERY,
+        fork_inst: type = StateHolder,
+        **kwargs) -> list:
+    """
+    Coroutine version of ``jsons.default_list_deserializer``. The elements are
+    deserialized on the event loop, which lets other coroutines run after
+    every ``yield_every`` elements. Every single element is deserialized at
+    once, nested lists included.
+    :param obj: the list that needs deserializing.
+    :param cls: the type optionally with a generic (e.g. List[str]).
+    :param warn_on_fail: if ``True``, will warn upon any failure and continue.
+    :param yield_every: the number of elements between two yields.
+    :param fork_inst: if given, it uses this fork of ``JsonSerializable``.
+    :param kwargs: any keyword arguments.
+    :return: a deserialized list instance.
+    """
+    _check_yield_every(yield_every)
+    cls_, kwargs_ = _get_elem_cls_and_kwargs(cls, kwargs)
+    if cls_ in get_trivial_types(fork_inst):
+        result = _load_trivial(obj, cls_)
+        if result is not None:
+            return result
+    elems = _iter_load(obj, cls_, warn_on_fail, fork_inst, kwargs_)
+    return await _consume(elems, yield_every)
+
+
+async def default_dict_deserializer(
+        obj: dict,
+        cls: type = None,
+        *,
+        key_transformer: Optional[Callable[[str], str]] = None,
+        yield_every: int = YIELD_EVERY,
+        **kwargs) -> dict:
+    """
+    Coroutine version of ``jsons.default_dict_deserializer``. The items are
+    deserialized on the event loop, which lets other coroutines run after
+    every ``yield_every`` items. Every single item is deserialized at once,
+    nested dicts included.
+    :param obj: the dict that needs deserializing.
+    :param cls: the type optionally with generics (e.g. Dict[str, int]).
+    :param key_transformer: a function that transforms the keys to a different
+    style (e.g. PascalCase).
+    :param yield_every: the number of items between two yields.
+    :param kwargs: any keyword arguments.
+    :return: a deserialized dict instance.
+    """
+    _check_yield_every(yield_every)
+    cls_args = get_args(cls)
+    obj_, keys_were_hashed = _load_hashed_keys(
+        obj, cls, cls_args, key_transformer=key_transformer, **kwargs)
+    items = _iter_deserialize(obj_, cls_args, key_transformer,
+                              keys_were_hashed, kwargs)
+    return dict(await _consume(items, yield_every))
+
+
+def set_executor(executor: Optional[Executor]):
+    """
+    Set the executor (e.g. a ``ThreadPoolExecutor``) on which the coroutines
+    of this module (de)serialize large payloads. If no executor is set, the
+    default executor of the event loop is used. With a
+    ``ProcessPoolExecutor``, all arguments and results must be picklable.
+    :param executor: the executor or ``None`` to use the one of the loop.
+    :return: None.
+    """
+    global _executor
+    _executor = executor
+
+
+def set_threshold(threshold: int):
+    """
+    Set the size from which the coroutines of this module (de)serialize
+    payloads on an executor rather than on the event loop.
+    :param threshold: the size, e.g. ``0`` to offload all payloads.
+    :return: None.
+    """
+    global _threshold
+    _threshold = threshold
+
+
+async def _run(func: Callable,
+               size: float,
+               offload_to: Optional[Executor],
+               threshold: Optional[int],
+               args: tuple,
+               kwargs: dict) -> object:
+    # Call func right away if size is below the threshold, or await the call
+    # on an executor otherwise. The args and kwargs are passed as they are,
+    # as kwargs may hold e.g. an executor for jsons.load.
+    if size < _get_threshold(threshold):
+        return func(*args, **kwargs)
+    loop = _get_running_loop()
+    return await loop.run_in_executor(offload_to or _executor,
+                                      partial(func, *args, **kwargs))
+
+
+async def _consume(iterator: Iterator, yield_every: int) -> list:
+    # Return all elements of iterator, letting other coroutines run after
+    # every yield_every elements.
+    result = []
+    for elem in iterator:
+        result.append(elem)
+        if not len(result) % yield_every:
+            await asyncio.sleep(0)
+    return result
+
+
+def _check_yield_every(yield_every: int):
+    if yield_every < 1:
+        raise JsonsError('Invalid value for yield_every: {}'
+                         .format(yield_every))
+
+
+def _get_threshold(threshold: Optional[int]) -> float:
+    # Return the given threshold, or the one that is set if None.
+    return _threshold if threshold is None else threshold
+
+
+def _get_size(obj: object, threshold: Optional[int]) -> int:
+    # Return the estimated size of obj, including the objects that it holds.
+    # The estimation stops once the size reaches the threshold or once
+    # MAX_NODES objects have been visited.
+    limit = _get_threshold(threshold)
+    size = 0
+    nodes = [obj]
+    visited = 0
+    while nodes and size < limit and visited < MAX_NODES:
+        node = nodes.pop()
+        visited += 1
+        if isinstance(node, (str, bytes, bytearray)):
+            size += len(node)
+            continue
+        if isinstance(node, dict):
+            children = node.values()
+        elif isinstance(node, (list, tuple, set, frozenset)):
+            children = node
+        elif hasattr(node, '__dict__'):
+            children = vars(node).values()
+        else:
+            continue
+        size += len(children) * ELEMENT_SIZE
+        if size < limit:
+            nodes.extend(children)
+    return size
+
+
+def _get_stream_size(fp: object) -> float:
+    # Return the number of characters or bytes that are left in fp, or
+    # infinity if that is unknown.
+    try:
+        if fp.seekable():
+            position = fp.tell()
+            size = fp.seek(0, io.SEEK_END) - position
+            fp.seek(position)
+            return size
+    except (AttributeError, OSError):
+        pass
+    return float('inf')
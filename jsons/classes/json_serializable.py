@@ -1,10 +1,12 @@
-from typing import Optional, Type
+from typing import Iterator, Optional, Type
 
 from jsons._common_impl import StateHolder, T
 from jsons._dump_impl import dump, dumps, dumpb
 from jsons._fork_impl import fork
+from jsons._lines_impl import load_lines
 from jsons._lizers_impl import set_serializer, set_deserializer
 from jsons._load_impl import load, loads, loadb
+from jsons._stream_impl import dump_to, load_from, iter_load
 
 
 class JsonSerializable(StateHolder):
@@ -167,6 +169,16 @@ class JsonSerializable(StateHolder):
         """
         return dumpb(self, fork_inst=self.__class__, **kwargs)
 
+    def dump_to(self, fp: object, **kwargs) -> None:
+        """
+        See ``jsons.dump_to``.
+        :param fp: the file-like object to which this instance is written.
+        :param kwargs: the keyword args are passed on to the serializer
+        function.
+        :return: None.
+        """
+        dump_to(self, fp, fork_inst=self.__class__, **kwargs)
+
     @classmethod
     def loadb(cls: Type[T], json_obj: bytes, **kwargs) -> T:
         """
@@ -178,6 +190,42 @@ class JsonSerializable(StateHolder):
         """
         return loadb(json_obj, cls, fork_inst=cls, **kwargs)
 
+    @classmethod
+    def load_from(cls: Type[T], fp: object, **kwargs) -> T:
+        """
+        See ``jsons.load_from``.
+        :param fp: the file-like object from which an instance of `cls` is
+        read.
+        :param kwargs: the keyword args are passed on to the deserializer
+        function.
+        :return: an instance of `cls`.
+        """
+        return load_from(fp, cls, fork_inst=cls, **kwargs)
+
+    @classmethod
+    def iter_load(cls: Type[T], fp: object, **kwargs) -> Iterator[T]:
+        """
+        See ``jsons.iter_load``.
+        :param fp: the file-like object from which instances of `cls` are
+        read.
+        :param kwargs: the keyword args are passed on to the deserializer
+        function.
+        :return: a generator of instances of `cls`.
+        """
+        return iter_load(fp, cls, fork_inst=cls, **kwargs)
+
+    @classmethod
+    def load_lines(cls: Type[T], fp: object, **kwargs) -> Iterator[T]:
+        """
+        See ``jsons.load_lines``.
+        :param fp: the file-like object from which instances of `cls` are
+        read, one on every line.
+        :param kwargs: the keyword args are passed on to the deserializer
+        function.
+        :return: a generator of instances of `cls`.
+        """
+        return load_lines(fp, cls, fork_inst=cls, **kwargs)
+
     @classmethod
     def set_serializer(cls: Type[T],
                        func: callable,
@@ -2,9 +2,11 @@
 This module contains decorators that facilitate the `jsons` functions in an
 alternative fashion.
 """
+from asyncio import iscoroutine
 from inspect import signature, Parameter, isawaitable, iscoroutinefunction
 
 from jsons import JsonSerializable, dump, load, loads, loadb, dumps, dumpb
+from jsons import aio
 from jsons.exceptions import InvalidDecorationError
 
 
@@ -123,14 +125,24 @@ def _get_async_wrapper(
         fork_inst,
         mapper,
         mapper_kwargs):
+    # The coroutine version of the mapper (e.g. aio.load for load) offloads
+    # large payloads, so that they do not block the event loop.
+    async_mapper = getattr(aio, mapper.__name__)
+
     async def _async_wrapper(*args, **kwargs):
-        result = _run_decorated(decorated, mapper if parameters else None,
-                                fork_inst, args, kwargs, mapper_kwargs)
+        new_args = args
+        if parameters:
+            new_args = _map_args(args, decorated, fork_inst, async_mapper,
+                                 mapper_kwargs)
+            for i, arg in enumerate(new_args):
+                if iscoroutine(arg):
+                    new_args[i] = await arg
+        result = decorated(*new_args, **kwargs)
         if isawaitable(result):
             result = await result
         if returnvalue:
-            result = _map_returnvalue(result, decorated, fork_inst, mapper,
-                                      mapper_kwargs)
+            result = await _map_returnvalue(result, decorated, fork_inst,
+                                            async_mapper, mapper_kwargs)
         return result
 
     return _async_wrapper
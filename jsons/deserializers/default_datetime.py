@@ -1,7 +1,6 @@
-import datetime
-import re
+from datetime import datetime
 
-from jsons._datetime_impl import get_datetime_inst, RFC3339_DATETIME_PATTERN
+from jsons._datetime_impl import parse_datetime
 
 
 def default_datetime_deserializer(obj: str,
@@ -14,11 +13,4 @@ def default_datetime_deserializer(obj: str,
     :param kwargs: not used.
     :return: a ``datetime.datetime`` instance.
     """
-    pattern = RFC3339_DATETIME_PATTERN
-    if '.' in obj:
-        pattern += '.%f'
-        # strptime allows a fraction of length 6, so trip the rest (if exists).
-        regex_pattern = re.compile(r'(\.[0-9]+)')
-        frac = regex_pattern.search(obj).group()
-        obj = obj.replace(frac, frac[0:7])
-    return get_datetime_inst(obj, pattern)
+    return parse_datetime(obj)
@@ -1,4 +1,4 @@
-from typing import Callable, Optional, Tuple
+from typing import Callable, Iterator, Optional, Tuple
 
 from typish import get_args
 
@@ -26,7 +26,8 @@ def default_dict_deserializer(
     obj_, keys_were_hashed = _load_hashed_keys(
         obj, cls, cls_args, key_transformer=key_transformer, **kwargs)
 
-    return _deserialize(obj_, cls_args, key_transformer, keys_were_hashed, kwargs)
+    return dict(_iter_deserialize(obj_, cls_args, key_transformer,
+                                  keys_were_hashed, kwargs))
 
 
 def _load_hashed_keys(
@@ -62,12 +63,13 @@ def _load_hashed_keys(
     return result, len(stored_keys) > 0
 
 
-def _deserialize(
+def _iter_deserialize(
         obj: dict,
         cls_args: tuple,
         key_transformer: Callable[[str], str],
         keys_were_hashed: bool,
-        kwargs: dict) -> dict:
+        kwargs: dict) -> Iterator[Tuple[object, object]]:
+    # Yield the deserialized items of obj one by one.
     key_transformer = key_transformer or (lambda key: key)
     key_func = key_transformer
     kwargs_ = {**kwargs, 'key_transformer': key_transformer}
@@ -81,7 +83,5 @@ def _deserialize(
             # hashed though, they have been loaded already.
             kwargs_k = {**kwargs, 'cls': cls_k}
             key_func = lambda key: load(key_transformer(key), **kwargs_k)
-    return {
-        key_func(key): load(obj[key], **kwargs_)
-        for key in obj
-    }
+    for key in obj:
+        yield key_func(key), load(obj[key], **kwargs_)
@@ -1,10 +1,11 @@
+from concurrent.futures import Executor
 from multiprocessing import Process
-from typing import Type
+from typing import Iterable, Iterator, Optional, Tuple, Type
 
 from typish import get_args
 
 from jsons._common_impl import StateHolder
-from jsons._load_impl import load
+from jsons._load_impl import load, get_loader, get_trivial_types
 from jsons._multitasking import multi_task
 from jsons.exceptions import JsonsError, DeserializationError
 
@@ -16,6 +17,7 @@ def default_list_deserializer(
         warn_on_fail: bool = False,
         tasks: int = 1,
         task_type: type = Process,
+        executor: Optional[Executor] = None,
         fork_inst: Type[StateHolder] = StateHolder,
         **kwargs) -> list:
     """
@@ -25,10 +27,26 @@ def default_list_deserializer(
     :param warn_on_fail: if ``True``, will warn upon any failure and continue.
     :param tasks: the allowed number of tasks (threads or processes).
     :param task_type: the type that is used for multitasking.
+    :param executor: if given, this executor runs the tasks.
     :param fork_inst: if given, it uses this fork of ``JsonSerializable``.
     :param kwargs: any keyword arguments.
     :return: a deserialized list instance.
     """
+    cls_, kwargs_ = _get_elem_cls_and_kwargs(cls, kwargs)
+    if tasks == 1:
+        result = _do_load(obj, cls_, warn_on_fail, fork_inst, kwargs_)
+    elif tasks > 1:
+        result = multi_task(load, obj, tasks, task_type, cls_,
+                            executor=executor, fork_inst=fork_inst,
+                            **kwargs_)
+    else:
+        raise JsonsError('Invalid number of tasks: {}'.format(tasks))
+    return result
+
+
+def _get_elem_cls_and_kwargs(cls: type, kwargs: dict) -> Tuple[type, dict]:
+    # Return the type of the elements of cls (if any) and the kwargs with
+    # which these are to be loaded.
     cls_ = None
     kwargs_ = {**kwargs}
     cls_args = get_args(cls)
@@ -37,14 +55,7 @@ def default_list_deserializer(
         # Mark the cls as 'inferred' so that later it is known where cls came
         # from and the precedence of classes can be determined.
         kwargs_['_inferred_cls'] = True
-
-    if tasks == 1:
-        result = _do_load(obj, cls_, warn_on_fail, fork_inst, kwargs_)
-    elif tasks > 1:
-        result = multi_task(load, obj, tasks, task_type, cls_, **kwargs_)
-    else:
-        raise JsonsError('Invalid number of tasks: {}'.format(tasks))
-    return result
+    return cls_, kwargs_
 
 
 def _do_load(
@@ -53,10 +64,25 @@ def _do_load(
         warn_on_fail: bool,
         fork_inst: Type[StateHolder],
         kwargs) -> list:
-    result = []
+    if cls in get_trivial_types(fork_inst):
+        result = _load_trivial(obj, cls)
+        if result is not None:
+            return result
+
+    return list(_iter_load(obj, cls, warn_on_fail, fork_inst, kwargs))
+
+
+def _iter_load(
+        obj: Iterable,
+        cls: type,
+        warn_on_fail: bool,
+        fork_inst: Type[StateHolder],
+        kwargs) -> Iterator:
+    # Yield the loaded elements of obj one by one.
+    loader = get_loader(cls, tasks=1, fork_inst=fork_inst, **kwargs)
     for index, elem in enumerate(obj):
         try:
-            result.append(load(elem, cls=cls, tasks=1, fork_inst=fork_inst, **kwargs))
+            yield loader(elem)
         except DeserializationError as err:
             new_msg = ('Could not deserialize element at index %s. %s' %
                        (index, err.message))
@@ -66,4 +92,13 @@ def _do_load(
                 new_err = DeserializationError(new_msg, err.source, err.target)
                 raise new_err from err
 
-    return result
+
+def _load_trivial(obj: list, cls: type) -> Optional[list]:
+    # Load all elements of obj at once if no element needs more than what the
+    # default primitive deserializers would do. Return None otherwise.
+    types = set(map(type, obj))
+    if types <= {cls} or (cls is int and types <= {int, bool}):
+        return list(obj)
+    if cls is float and types <= {int, float, bool}:
+        return list(map(float, obj))
+    return None
@@ -10,10 +10,14 @@ from jsons._common_impl import (
     can_match_with_none
 )
 from jsons._compatibility_impl import get_type_hints
-from jsons._load_impl import load
+from jsons._load_impl import load, get_loader, get_trivial_types
 from jsons.exceptions import SignatureMismatchError, UnfulfilledArgumentError
 
 
+# The kwargs for which the loaders of a plan can be used.
+_PLAIN_KWARGS = frozenset({'strict', 'fork_inst', '_initial', '_inferred_cls'})
+
+
 def default_object_deserializer(
         obj: dict,
         cls: type,
@@ -37,7 +41,8 @@ def default_object_deserializer(
     """
     obj, kwargs = _check_and_transform_keys(obj, key_transformer, **kwargs)
     kwargs['strict'] = strict
-    constructor_args = _get_constructor_args(obj, cls, **kwargs)
+    plan = _get_plan(cls, strict, kwargs['fork_inst'])
+    constructor_args = _get_constructor_args(obj, cls, plan, **kwargs)
     remaining_attrs = _get_remaining_args(obj, cls, constructor_args,
                                           strict, kwargs['fork_inst'])
     instance = cls(**constructor_args)
@@ -48,30 +53,51 @@ def default_object_deserializer(
 def _get_constructor_args(
         obj,
         cls,
+        plan,
         meta_hints,
         attr_getters=None,
         **kwargs) -> dict:
-    # Loop through the signature of cls: the type we try to deserialize to. For
+    # Loop through the plan of cls: the type we try to deserialize to. For
     # every required parameter, we try to get the corresponding value from
     # json_obj.
-    signature_parameters = _get_signature(cls)
-    hints = get_type_hints(cls.__init__, fallback_ns=cls.__module__)
     attr_getters = dict(**(attr_getters or {}))
 
     result = {}
+    for param in plan:
+        key, value = _get_value_for_attr(obj=obj,
+                                         orig_cls=cls,
+                                         param=param,
+                                         meta_hints=meta_hints,
+                                         attr_getters=attr_getters,
+                                         **kwargs)
+        if key:
+            result[key] = value
+    return result
+
+
+@cached
+def _get_plan(
+        cls: type,
+        strict: bool,
+        fork_inst: type) -> Tuple[tuple, ...]:
+    # A plan is a tuple of (sig_key, cls, default, is_var, accepts_none,
+    # loader) tuples; one for each parameter of the constructor of cls. The
+    # loader holds the resolved deserializer of the parameter type.
+    signature_parameters = _get_signature(cls)
+    hints = get_type_hints(cls.__init__, fallback_ns=cls.__module__)
+    plan = []
     for sig_key, sig in signature_parameters.items():
         if sig_key != 'self':
-            key, value = _get_value_for_attr(obj=obj,
-                                             orig_cls=cls,
-                                             meta_hints=meta_hints,
-                                             attr_getters=attr_getters,
-                                             sig_key=sig_key,
-                                             cls=hints.get(sig_key, None),
-                                             sig=sig,
-                                             **kwargs)
-            if key:
-                result[key] = value
-    return result
+            param_cls = hints.get(sig_key, None)
+            is_var = sig.kind in (inspect.Parameter.VAR_POSITIONAL,
+                                  inspect.Parameter.VAR_KEYWORD)
+            loader = None
+            if param_cls:
+                loader = get_loader(param_cls, strict=strict,
+                                    fork_inst=fork_inst)
+            plan.append((sig_key, param_cls, sig.default, is_var,
+                         can_match_with_none(param_cls), loader))
+    return tuple(plan)
 
 
 @cached
@@ -81,30 +107,28 @@ def _get_signature(cls):
 
 def _get_value_for_attr(
         obj,
-        cls,
         orig_cls,
-        sig_key,
-        sig,
+        param,
         meta_hints,
         attr_getters,
         **kwargs):
     # Find a value for the attribute (with signature sig_key).
+    sig_key, cls, default, is_var, accepts_none, loader = param
     if obj and sig_key in obj:
         # This argument is in obj.
-        result = sig_key, _get_value_from_obj(obj, cls, sig, sig_key,
-                                              meta_hints, **kwargs)
+        result = sig_key, _get_value_from_obj(obj, cls, sig_key, meta_hints,
+                                              loader, **kwargs)
     elif sig_key in attr_getters:
         # There exists an attr_getter for this argument.
         attr_getter = attr_getters.pop(sig_key)
         result = sig_key, attr_getter()
-    elif sig.default != inspect.Parameter.empty:
+    elif default != inspect.Parameter.empty:
         # There is a default value for this argument.
-        result = sig_key, sig.default
-    elif sig.kind in (inspect.Parameter.VAR_POSITIONAL,
-                      inspect.Parameter.VAR_KEYWORD):
+        result = sig_key, default
+    elif is_var:
         # This argument is either *args or **kwargs.
         result = None, None
-    elif can_match_with_none(cls):
+    elif accepts_none:
         # It is fine that there is no value.
         result = sig_key, None
     else:
@@ -119,14 +143,20 @@ def _remove_prefix(prefix: str, s: str) -> str:
     return s
 
 
-def _get_value_from_obj(obj, cls, sig, sig_key, meta_hints, **kwargs):
+def _get_value_from_obj(obj, cls, sig_key, meta_hints, loader, **kwargs):
     # Obtain the value for the attribute with the given signature from the
     # given obj. Try to obtain the class of this attribute from the meta info
     # or from type hints.
-    cls_key = '/{}'.format(sig_key)
-    cls_str_from_meta = meta_hints.get(cls_key, None)
+    if (loader and not meta_hints and not kwargs.get('_inferred_cls')
+            and _PLAIN_KWARGS.issuperset(kwargs)):
+        # The loader of the plan was made for these very kwargs.
+        return loader(obj[sig_key])
     new_hints = meta_hints
     cls_from_meta = None
+    cls_str_from_meta = None
+    if meta_hints:
+        cls_key = '/{}'.format(sig_key)
+        cls_str_from_meta = meta_hints.get(cls_key, None)
     if cls_str_from_meta:
         cls_from_meta = get_cls_from_str(
             cls_str_from_meta, obj, kwargs['fork_inst'])
@@ -137,7 +167,10 @@ def _get_value_from_obj(obj, cls, sig, sig_key, meta_hints, **kwargs):
         }
     cls_ = determine_precedence(cls=cls, cls_from_meta=cls_from_meta,
                                 cls_from_type=None, inferred_cls=True)
-    value = load(obj[sig_key], cls_, meta_hints=new_hints, **kwargs)
+    value = obj[sig_key]
+    if type(value) is not cls_ or cls_ not in get_trivial_types(
+            kwargs['fork_inst']):
+        value = load(value, cls_, meta_hints=new_hints, **kwargs)
     return value
 
 
@@ -147,8 +180,8 @@ def _set_remaining_attrs(instance,
                          **kwargs):
     # Set any remaining attributes on the newly created instance.
     attr_getters = attr_getters or {}
+    annotations = get_type_hints(instance.__class__) if remaining_attrs else {}
     for attr_name in remaining_attrs:
-        annotations = get_type_hints(instance.__class__)
         attr_type = annotations.get(attr_name)
 
         if isinstance(remaining_attrs[attr_name], dict) \
@@ -1,27 +1,45 @@
 from datetime import datetime
 from typing import Optional
 
+from jsons._common_impl import StateHolder
+from jsons._datetime_impl import may_be_datetime
 from jsons._load_impl import load
+from jsons._lizers_impl import get_deserializer
+from jsons.deserializers.default_datetime import default_datetime_deserializer
 from jsons.deserializers.default_primitive import default_primitive_deserializer
 from jsons.exceptions import DeserializationError
 
 
 def default_string_deserializer(obj: str,
                                 cls: Optional[type] = None,
+                                *,
+                                infer_datetimes: bool = True,
                                 **kwargs) -> object:
     """
     Deserialize a string. If the given ``obj`` can be parsed to a date, a
     ``datetime`` instance is returned.
     :param obj: the string that is to be deserialized.
     :param cls: not used.
+    :param infer_datetimes: if ``False``, strings are never turned into
+    ``datetime`` instances.
     :param kwargs: any keyword arguments.
     :return: the deserialized obj.
     """
     target_is_str = cls is str and not kwargs.get('_inferred_cls')
     if target_is_str:
         return str(obj)
-    try:
-        result = load(obj, datetime, **kwargs)
-    except DeserializationError:
-        result = default_primitive_deserializer(obj, str)
-    return result
+    if infer_datetimes and (may_be_datetime(obj)
+                            or _has_custom_datetime_deserializer(kwargs)):
+        try:
+            return load(obj, datetime, **kwargs)
+        except DeserializationError:
+            pass
+    return default_primitive_deserializer(obj, str)
+
+
+def _has_custom_datetime_deserializer(kwargs: dict) -> bool:
+    # Return True if datetimes are not loaded by the default deserializer, in
+    # which case strings cannot be screened beforehand.
+    fork_inst = kwargs.get('fork_inst', StateHolder)
+    deserializer = get_deserializer(datetime, fork_inst)
+    return deserializer is not default_datetime_deserializer
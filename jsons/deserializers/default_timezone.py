@@ -1,5 +1,6 @@
 from datetime import timezone, timedelta
 
+from jsons._datetime_impl import get_timezone
 from jsons._load_impl import load
 
 
@@ -13,4 +14,4 @@ def default_timezone_deserializer(obj: dict,
     :param kwargs: not used.
     :return: a ``datetime.timezone`` instance.
     """
-    return timezone(load(obj['offset'], timedelta), obj['name'])
+    return get_timezone(load(obj['offset'], timedelta), obj['name'])
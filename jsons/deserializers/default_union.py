@@ -1,8 +1,20 @@
-from typing import Union
+from typing import Any, Union
 
-from jsons._common_impl import get_class_name
+from jsons._cache import cached
+from jsons._common_impl import (
+    META_ATTR,
+    NoneType,
+    StateHolder,
+    VALID_TYPES,
+    can_match_with_none,
+    get_class_name,
+)
 from jsons._compatibility_impl import get_union_params
+from jsons._lizers_impl import get_deserializer
 from jsons._load_impl import load
+from jsons.deserializers.default_nonetype import default_nonetype_deserializer
+from jsons.deserializers.default_object import default_object_deserializer
+from jsons.deserializers.default_primitive import default_primitive_deserializer
 from jsons.exceptions import JsonsError, DeserializationError
 
 
@@ -17,7 +29,14 @@ def default_union_deserializer(obj: object, cls: Union, **kwargs) -> object:
     :return: An object of the first type of the Union that could be
     deserialized successfully.
     """
-    for sub_type in get_union_params(cls):
+    if isinstance(obj, dict) and META_ATTR in obj:
+        # The meta info may point to any type, so all are tried.
+        sub_types = get_union_params(cls)
+    else:
+        fork_inst = kwargs.get('fork_inst', StateHolder)
+        sub_types = _get_candidates(tuple(get_union_params(cls)), type(obj),
+                                    fork_inst)
+    for sub_type in sub_types:
         try:
             return load(obj, sub_type, **kwargs)
         except JsonsError:
@@ -28,3 +47,35 @@ def default_union_deserializer(obj: object, cls: Union, **kwargs) -> object:
         err_msg = ('Could not match the object of type "{}" to any type of '
                    'the Union: {}'.format(type(obj).__name__, args_msg))
         raise DeserializationError(err_msg, obj, cls)
+
+
+@cached
+def _get_candidates(
+        sub_types: tuple,
+        json_type: type,
+        fork_inst: type) -> tuple:
+    # Return the sub_types of a Union in their original order, leaving out
+    # those into which a value of json_type certainly cannot be loaded. The
+    # sub_types are the key, as Unions that only differ in order are equal.
+    return tuple(sub_type for sub_type in sub_types
+                 if not _certainly_fails(json_type, sub_type, fork_inst))
+
+
+def _certainly_fails(json_type: type, sub_type: type, fork_inst: type) -> bool:
+    # Return True if load would certainly raise for a value of json_type and
+    # sub_type. This is decided for the default deserializers only.
+    if json_type is NoneType:
+        return not can_match_with_none(sub_type)
+    if (json_type not in VALID_TYPES or json_type == sub_type
+            or sub_type is Any or isinstance(sub_type, str)):
+        return False
+    deserializer = get_deserializer(sub_type, fork_inst)
+    if deserializer is default_nonetype_deserializer:
+        return True
+    if deserializer is default_primitive_deserializer:
+        # E.g. int([]) raises, while bool([]) does not.
+        return sub_type in (int, float) and json_type in (list, dict)
+    if deserializer is default_object_deserializer:
+        # The attributes are looked up in the value.
+        return json_type in (int, float, bool)
+    return False
@@ -22,6 +22,16 @@ class JsonsError(Exception):
     def message(self):
         return self._message
 
+    def __reduce__(self):
+        # Errors are restored without calling their constructors, which take
+        # different arguments. This allows them to be pickled (e.g. to pass
+        # them on from another process).
+        return _restore_error, (self.__class__, self.args), self.__dict__
+
+
+def _restore_error(cls: type, args: tuple) -> JsonsError:
+    return cls.__new__(cls, *args)
+
 
 class ValidationError(JsonsError):
     """
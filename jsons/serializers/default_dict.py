@@ -1,7 +1,7 @@
 from typing import Callable, Dict, Optional, Tuple
 
-from jsons._common_impl import JSON_KEYS
-from jsons._dump_impl import dump
+from jsons._common_impl import JSON_KEYS, StateHolder
+from jsons._dump_impl import dump, get_native_types
 
 
 def default_dict_serializer(
@@ -33,6 +33,7 @@ def default_dict_serializer(
     """
     result = dict()
     types = types or dict()
+    native_types = get_native_types(kwargs.get('fork_inst', StateHolder))
     for key in obj:
         obj_ = obj[key]
         cls_ = types.get(key, None)
@@ -46,12 +47,16 @@ def default_dict_serializer(
         if dict_and_key:
             result, key = dict_and_key
 
-        dumped_elem = dump(obj_,
-                           cls=cls_,
-                           key_transformer=key_transformer,
-                           strip_nulls=strip_nulls,
-                           strict=strict,
-                           **kwargs)
+        if type(obj_) in native_types and cls_ in (None, type(obj_)):
+            # JSON native values are dumped as they are.
+            dumped_elem = obj_
+        else:
+            dumped_elem = dump(obj_,
+                               cls=cls_,
+                               key_transformer=key_transformer,
+                               strip_nulls=strip_nulls,
+                               strict=strict,
+                               **kwargs)
         if not (strip_nulls and dumped_elem is None):
             if key_transformer:
                 key = key_transformer(key)
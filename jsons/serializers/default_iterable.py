@@ -1,10 +1,12 @@
 from collections.abc import Iterable
+from concurrent.futures import Executor
 from multiprocessing import Process
 from typing import Tuple, Optional
 
 from typish import get_args, get_type
 
-from jsons._dump_impl import dump
+from jsons._common_impl import StateHolder
+from jsons._dump_impl import dump, get_native_types
 from jsons._multitasking import multi_task
 from jsons.exceptions import SerializationError
 
@@ -16,6 +18,7 @@ def default_iterable_serializer(
         strict: bool = False,
         tasks: int = 1,
         task_type: type = Process,
+        executor: Optional[Executor] = None,
         **kwargs) -> list:
     """
     Serialize the given ``obj`` to a list of serialized objects.
@@ -25,6 +28,7 @@ def default_iterable_serializer(
     (i.e. only dumping stuff that is known to ``cls``).
     :param tasks: the allowed number of tasks (threads or processes).
     :param task_type: the type that is used for multitasking.
+    :param executor: if given, this executor runs the tasks.
     :param kwargs: any keyword arguments that may be given to the serialization
     process.
     :return: a list of which all elements are serialized.
@@ -40,11 +44,16 @@ def default_iterable_serializer(
         subclasses = _get_subclasses(obj, None)
 
     if tasks < 2:
-        result = [dump(elem, cls=subclasses[i], **kwargs_)
+        native_types = get_native_types(kwargs.get('fork_inst', StateHolder))
+        # JSON native elements are dumped as they are.
+        result = [elem if type(elem) in native_types
+                  and subclasses[i] in (None, type(elem))
+                  else dump(elem, cls=subclasses[i], **kwargs_)
                   for i, elem in enumerate(obj)]
     else:
         zipped_objs = list(zip(obj, subclasses))
-        result = multi_task(_do_dump, zipped_objs, tasks, task_type, **kwargs_)
+        result = multi_task(_do_dump, zipped_objs, tasks, task_type,
+                            executor=executor, **kwargs_)
 
     return result
 
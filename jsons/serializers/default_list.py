@@ -4,7 +4,8 @@ from typish import get_args
 
 from jsons import get_serializer
 from jsons._common_impl import StateHolder
-from jsons._dump_impl import dump
+from jsons._dump_impl import dump, dump_with_serializer, get_native_types
+from jsons._extra_impl import announce_class
 
 
 def default_list_serializer(
@@ -45,4 +46,37 @@ def default_list_serializer(
         inner_type = type(obj[0])
         serializer = get_serializer(inner_type, fork_inst)
 
+    native_types = get_native_types(fork_inst)
+    if inner_type is None:
+        return _dump_by_type(obj, native_types, fork_inst, kwargs_)
+    if inner_type in native_types:
+        return [elem if type(elem) is inner_type
+                else serializer(elem, cls=inner_type, fork_inst=fork_inst,
+                                **kwargs_)
+                for elem in obj]
     return [serializer(elem, cls=inner_type, fork_inst=fork_inst, **kwargs_) for elem in obj]
+
+
+def _dump_by_type(
+        obj: list,
+        native_types: frozenset,
+        fork_inst: type,
+        kwargs: dict) -> list:
+    # Dump the elements of obj like dump would, but resolve the serializer
+    # only once for each distinct type of element. JSON native elements are
+    # dumped as they are.
+    kwargs_ = {'fork_inst': fork_inst, '_initial': False, **kwargs}
+    serializers = {}
+    result = []
+    for elem in obj:
+        if type(elem) in native_types:
+            result.append(elem)
+            continue
+        elem_cls = elem.__class__
+        serializer = serializers.get(elem_cls)
+        if not serializer:
+            serializer = get_serializer(elem_cls, fork_inst)
+            announce_class(elem_cls, fork_inst=fork_inst)
+            serializers[elem_cls] = serializer
+        result.append(dump_with_serializer(elem, serializer, None, kwargs_))
+    return result
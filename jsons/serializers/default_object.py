@@ -10,6 +10,7 @@ from jsons._cache import cached
 from jsons._common_impl import get_class_name, META_ATTR, StateHolder
 from jsons._compatibility_impl import get_type_hints
 from jsons._datetime_impl import to_str
+from jsons._dump_impl import get_native_types
 from jsons.classes import JsonSerializable
 from jsons.classes.verbosity import Verbosity
 from jsons.exceptions import SerializationError
@@ -58,15 +59,12 @@ def default_object_serializer(
     of ``obj``.
     """
     strip_attr = _normalize_strip_attr(strip_attr)
-    if cls and strict:
-        attributes = _get_attributes_from_class(
-            cls, strip_privates, strip_properties, strip_class_variables,
-            strip_attr, strict)
-    else:
-        attributes = _get_attributes_from_object(
-            obj, strip_privates, strip_properties, strip_class_variables,
-            strip_attr, strict)
+    from_class = bool(cls and strict)
+    if not from_class:
         cls = obj.__class__
+    plan = _get_plan(obj, cls, from_class, strip_privates, strip_properties,
+                     strip_class_variables, strip_attr, strict,
+                     key_transformer, fork_inst)
 
     verbose = Verbosity.from_value(verbose)
     kwargs_ = {
@@ -77,17 +75,21 @@ def default_object_serializer(
         # Set a flag in kwargs to temporarily store -cls:
         '_store_cls': Verbosity.WITH_CLASS_INFO in verbose
     }
+    attr_kwargs = {
+        'key_transformer': key_transformer,
+        'strip_nulls': strip_nulls,
+        'strip_privates': strip_privates,
+        'strip_properties': strip_properties,
+        'strip_class_variables': strip_class_variables,
+        'strip_attr': strip_attr,
+        **kwargs_
+    }
 
     result = _do_serialize(obj=obj,
                            cls=cls,
-                           attributes=attributes,
-                           kwargs=kwargs_,
-                           key_transformer=key_transformer,
+                           plan=plan,
+                           kwargs=attr_kwargs,
                            strip_nulls=strip_nulls,
-                           strip_privates=strip_privates,
-                           strip_properties=strip_properties,
-                           strip_class_variables=strip_class_variables,
-                           strip_attr=strip_attr,
                            strict=strict,
                            fork_inst=fork_inst)
 
@@ -100,34 +102,27 @@ def default_object_serializer(
 def _do_serialize(
         obj: object,
         cls: type,
-        attributes: Dict[str, Optional[type]],
+        plan: Tuple[tuple, ...],
         kwargs: dict,
-        key_transformer: Optional[Callable[[str], str]] = None,
         strip_nulls: bool = False,
-        strip_privates: bool = False,
-        strip_properties: bool = False,
-        strip_class_variables: bool = False,
-        strip_attr: Union[str, MutableSequence[str], Tuple[str]] = None,
         strict: bool = False,
         fork_inst: Optional[type] = StateHolder) -> Dict[str, object]:
     result = dict()
-    is_attrs_cls = getattr(cls, '__attrs_attrs__', None) is not None
-    make_attributes_public = is_attrs_cls and not strip_privates
-    for attr_name, cls_ in attributes.items():
+    native_types = get_native_types(fork_inst)
+    for attr_name, cls_, serializer, key in plan:
         attr = getattr(obj, attr_name)
-        attr_type = cls_ or type(attr)
-        announce_class(attr_type, fork_inst=fork_inst)
-        serializer = get_serializer(attr_type, fork_inst)
+        if type(attr) in native_types and cls_ in (None, type(attr)):
+            # JSON native values are dumped as they are.
+            if not (strip_nulls and attr is None):
+                result[key] = attr
+            continue
+        if not serializer:
+            # No type hint, so the serializer depends on the value.
+            attr_type = type(attr)
+            announce_class(attr_type, fork_inst=fork_inst)
+            serializer = get_serializer(attr_type, fork_inst)
         try:
-            dumped_elem = serializer(attr,
-                                     cls=cls_,
-                                     key_transformer=key_transformer,
-                                     strip_nulls=strip_nulls,
-                                     strip_privates=strip_privates,
-                                     strip_properties=strip_properties,
-                                     strip_class_variables=strip_class_variables,
-                                     strip_attr=strip_attr,
-                                     **kwargs)
+            dumped_elem = serializer(attr, cls=cls_, **kwargs)
             _store_cls_info(dumped_elem, attr, kwargs)
         except Exception as err:
             if strict:
@@ -140,30 +135,110 @@ def _do_serialize(
                                 'attribute-not-serialized')
                 break
 
-        if make_attributes_public:
-            attr_name = attr_name.lstrip('_')
-        _add_dumped_elem(result, attr_name, dumped_elem,
-                         strip_nulls, key_transformer)
+        if not (strip_nulls and dumped_elem is None):
+            result[key] = dumped_elem
     return result
 
 
-def _add_dumped_elem(
-        result: dict,
-        attr_name: str,
-        dumped_elem: object,
-        strip_nulls: bool,
-        key_transformer: Optional[Callable[[str], str]]):
-    if not (strip_nulls and dumped_elem is None):
+def _get_plan(
+        obj: object,
+        cls: type,
+        from_class: bool,
+        strip_privates: bool,
+        strip_properties: bool,
+        strip_class_variables: bool,
+        strip_attr: tuple,
+        strict: bool,
+        key_transformer: Optional[Callable[[str], str]],
+        fork_inst: type) -> Tuple[tuple, ...]:
+    # Return the plan for serializing obj. The plan is cached per class (and
+    # per set of instance attributes) whenever that is possible.
+    if from_class:
+        return _compile_plan(cls, None, strip_privates, strip_properties,
+                             strip_class_variables, strip_attr, strict,
+                             key_transformer, fork_inst)
+    instance_attrs = _get_instance_attrs(obj)
+    if instance_attrs is None:
+        # The attributes of obj cannot be derived from its class.
+        attributes = _get_attributes_from_object(
+            obj, strip_privates, strip_properties, strip_class_variables,
+            strip_attr, strict)
+        return _make_plan(cls, attributes, strip_privates, key_transformer,
+                          fork_inst)
+    return _compile_plan(cls, instance_attrs, strip_privates,
+                         strip_properties, strip_class_variables, strip_attr,
+                         strict, key_transformer, fork_inst)
+
+
+@cached
+def _compile_plan(
+        cls: type,
+        instance_attrs: Optional[tuple],
+        strip_privates: bool,
+        strip_properties: bool,
+        strip_class_variables: bool,
+        strip_attr: tuple,
+        strict: bool,
+        key_transformer: Optional[Callable[[str], str]],
+        fork_inst: type) -> Tuple[tuple, ...]:
+    # Compile a plan for serializing instances of cls. If instance_attrs is
+    # None, only the attributes that are known in the class are taken.
+    if instance_attrs is None:
+        attributes = _get_attributes_from_class(
+            cls, strip_privates, strip_properties, strip_class_variables,
+            strip_attr, strict)
+    else:
+        # This is equal to dir(obj) without requiring obj.
+        names = sorted(set(instance_attrs).union(dir(cls)))
+        attributes = _get_attributes_from_names(
+            cls, names, strip_privates, strip_properties,
+            strip_class_variables, strip_attr, strict)
+    return _make_plan(cls, attributes, strip_privates, key_transformer,
+                      fork_inst)
+
+
+def _make_plan(
+        cls: type,
+        attributes: Dict[str, Optional[type]],
+        strip_privates: bool,
+        key_transformer: Optional[Callable[[str], str]],
+        fork_inst: type) -> Tuple[tuple, ...]:
+    # A plan is a tuple of (attr_name, attr_type, serializer, key) tuples. The
+    # serializer is None if it can only be determined by the attribute value.
+    is_attrs_cls = getattr(cls, '__attrs_attrs__', None) is not None
+    make_attributes_public = is_attrs_cls and not strip_privates
+    plan = []
+    for attr_name, attr_type in attributes.items():
+        serializer = None
+        if attr_type:
+            announce_class(attr_type, fork_inst=fork_inst)
+            serializer = get_serializer(attr_type, fork_inst)
+        key = attr_name
+        if make_attributes_public:
+            key = key.lstrip('_')
         if key_transformer:
-            attr_name = key_transformer(attr_name)
-        result[attr_name] = dumped_elem
+            key = key_transformer(key)
+        plan.append((attr_name, attr_type, serializer, key))
+    return tuple(plan)
+
+
+def _get_instance_attrs(obj: object) -> Optional[tuple]:
+    # Return the names of the instance attributes of obj if dir(obj) can be
+    # derived from them and the class of obj. Return None otherwise.
+    cls = type(obj)
+    if (obj.__class__ is not cls
+            or cls.__dir__ is not object.__dir__
+            or type(cls).__dir__ is not type.__dir__):
+        return None
+    return tuple(getattr(obj, '__dict__', ()))
 
 
 def _normalize_strip_attr(strip_attr) -> tuple:
     # Make sure that strip_attr is always a tuple.
     strip_attr = strip_attr or tuple()
-    if (not isinstance(strip_attr, MutableSequence)
-            and not isinstance(strip_attr, tuple)):
+    if isinstance(strip_attr, MutableSequence):
+        strip_attr = tuple(strip_attr)
+    elif not isinstance(strip_attr, tuple):
         strip_attr = (strip_attr,)
     return strip_attr
 
@@ -191,10 +266,23 @@ def _get_attributes_from_object(
         strip_attr: tuple,
         strict: bool) -> Dict[str, Optional[type]]:
     # Get the attributes that are known in the object.
-    cls = obj.__class__
+    return _get_attributes_from_names(obj.__class__, dir(obj), strip_privates,
+                                      strip_properties, strip_class_variables,
+                                      strip_attr, strict)
+
+
+def _get_attributes_from_names(
+        cls: type,
+        names: list,
+        strip_privates: bool,
+        strip_properties: bool,
+        strip_class_variables: bool,
+        strip_attr: tuple,
+        strict: bool) -> Dict[str, Optional[type]]:
+    # Get the attributes with the given names, typed if known in the class.
     attributes_and_types = _get_attributes_and_types(cls, strict)
     attributes = {attr: attributes_and_types.get(attr, None)
-                  for attr in dir(obj)}
+                  for attr in names}
     return _filter_attributes(cls, attributes, strip_privates,
                               strip_properties, strip_class_variables,
                               strip_attr)
@@ -0,0 +1,187 @@
+import asyncio
+import io
+from concurrent.futures import ThreadPoolExecutor
+from threading import get_ident
+from typing import Dict, List
+from unittest import TestCase
+
+import jsons
+from jsons import aio
+from jsons.decorators import loaded
+
+
+class C:
+    def __init__(self, x: int):
+        self.x = x
+
+
+class ExecutorMock(ThreadPoolExecutor):
+    def __init__(self):
+        ThreadPoolExecutor.__init__(self, 1)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return ThreadPoolExecutor.submit(self, *args, **kwargs)
+
+
+class TestAio(TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.executor = ExecutorMock()
+
+    def tearDown(self):
+        aio.set_executor(None)
+        aio.set_threshold(aio.THRESHOLD)
+        self.loop.close()
+        self.executor.shutdown()
+
+    def _run(self, coroutine):
+        return self.loop.run_until_complete(coroutine)
+
+    def test_small_payloads_are_processed_inline(self):
+        loaded_obj = self._run(aio.loads('{"x": 1}', C,
+                                         offload_to=self.executor))
+        dumped = self._run(aio.dumps(C(1), offload_to=self.executor))
+
+        self.assertEqual(1, loaded_obj.x)
+        self.assertEqual('{"x": 1}', dumped)
+        self.assertEqual(0, self.executor.submitted)
+
+    def test_large_payloads_are_offloaded(self):
+        str_ = jsons.dumps([{'x': i} for i in range(10000)])
+        thread_ids = []
+
+        def _load_c(obj, cls, **kwargs):
+            thread_ids.append(get_ident())
+            return C(obj['x'])
+
+        fork_inst = jsons.fork()
+        jsons.set_deserializer(_load_c, C, fork_inst=fork_inst)
+        loaded_obj = self._run(aio.loads(str_, List[C], fork_inst=fork_inst,
+                                         offload_to=self.executor))
+        dumped = self._run(aio.dump(loaded_obj, offload_to=self.executor))
+
+        self.assertEqual(9999, loaded_obj[-1].x)
+        self.assertEqual(9999, dumped[-1]['x'])
+        self.assertEqual(2, self.executor.submitted)
+        self.assertNotIn(get_ident(), thread_ids)
+
+    def test_nested_payloads_are_offloaded(self):
+        large = {'items': [{'x': i} for i in range(2000)]}
+        large_str = [{'text': 'x' * 100000}]
+        small = {'items': [{'x': i} for i in range(10)]}
+
+        self._run(aio.load(large, offload_to=self.executor))
+        self._run(aio.dump(large_str, offload_to=self.executor))
+        self.assertEqual(2, self.executor.submitted)
+
+        self._run(aio.load(small, offload_to=self.executor))
+        self.assertEqual(2, self.executor.submitted)
+
+    def test_threshold(self):
+        self._run(aio.loadb(b'[1, 2]', List[int], threshold=0,
+                            offload_to=self.executor))
+        self.assertEqual(1, self.executor.submitted)
+
+        aio.set_executor(self.executor)
+        aio.set_threshold(0)
+        self._run(aio.dumpb([1, 2]))
+        self._run(aio.load([1, 2], List[int], threshold=1000))
+        self.assertEqual(2, self.executor.submitted)
+
+    def test_kwargs_are_passed_on(self):
+        dumped = self._run(aio.dumps(C(1), {'indent': 2}, threshold=0,
+                                     key_transformer=str.upper))
+
+        self.assertEqual('{\n  "X": 1\n}', dumped)
+
+    def test_dump_to_and_load_from(self):
+        fp = io.StringIO()
+        self._run(aio.dump_to([C(1), C(2)], fp, offload_to=self.executor))
+        fp.seek(0)
+        loaded_obj = self._run(aio.load_from(fp, List[C],
+                                             offload_to=self.executor))
+
+        self.assertListEqual([1, 2], [c.x for c in loaded_obj])
+        self.assertEqual(0, self.executor.submitted)
+
+        fp.seek(0)
+        self._run(aio.load_from(fp, List[C], threshold=10,
+                                offload_to=self.executor))
+        self.assertEqual(1, self.executor.submitted)
+
+    def test_errors_are_raised(self):
+        with self.assertRaises(jsons.DecodeError):
+            self._run(aio.loads('[1, 2', threshold=0))
+
+    def test_loaded_decorator_offloads(self):
+        aio.set_executor(self.executor)
+        aio.set_threshold(0)
+
+        @loaded()
+        async def func(c: C) -> C:
+            return {'x': c.x + 1}
+
+        result = self._run(func({'x': 1}))
+
+        self.assertEqual(2, result.x)
+        self.assertEqual(2, self.executor.submitted)
+
+    def _run_with_ticker(self, coroutine):
+        # Run coroutine along with one that counts how often it gets to run.
+        ticks = []
+
+        async def _tick():
+            while True:
+                ticks.append(1)
+                await asyncio.sleep(0)
+
+        async def _main():
+            ticker = asyncio.ensure_future(_tick())
+            try:
+                return await coroutine
+            finally:
+                ticker.cancel()
+
+        return self._run(_main()), len(ticks)
+
+    def test_default_list_deserializer(self):
+        objs = [{'x': i} for i in range(1000)]
+
+        result, ticks = self._run_with_ticker(
+            aio.default_list_deserializer(objs, List[C], yield_every=100))
+
+        self.assertListEqual(list(range(1000)), [c.x for c in result])
+        self.assertGreaterEqual(ticks, 10)
+
+    def test_default_list_deserializer_trivial(self):
+        result = self._run(aio.default_list_deserializer([1, 2], List[int]))
+
+        self.assertListEqual([1, 2], result)
+
+    def test_default_list_deserializer_fail(self):
+        with self.assertRaises(jsons.DeserializationError):
+            self._run(aio.default_list_deserializer([{'x': 1}, 2], List[C]))
+        with self.assertRaises(jsons.JsonsError):
+            self._run(aio.default_list_deserializer([], List[C],
+                                                    yield_every=0))
+
+    def test_default_dict_deserializer(self):
+        objs = {str(i): {'x': i} for i in range(1000)}
+
+        result, ticks = self._run_with_ticker(
+            aio.default_dict_deserializer(objs, Dict[int, C],
+                                          yield_every=100))
+
+        self.assertListEqual(list(range(1000)), list(result))
+        self.assertEqual(999, result[999].x)
+        self.assertGreaterEqual(ticks, 10)
+
+    def test_default_dict_deserializer_hashed_keys(self):
+        dumped = jsons.dump({(1, 2): 'a'}, Dict[tuple, str])
+
+        result = self._run(aio.default_dict_deserializer(
+            dumped, Dict[tuple, str]))
+
+        self.assertDictEqual({(1, 2): 'a'}, result)
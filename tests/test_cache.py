@@ -0,0 +1,181 @@
+from threading import Thread
+from unittest import TestCase
+
+import jsons
+from jsons._cache import _Wrapper, DEFAULT_MAX_SIZE, start_call, end_call
+
+
+class C:
+    def __init__(self, x: int):
+        self.x = x
+
+
+class TestCache(TestCase):
+    def tearDown(self):
+        jsons.persist_cache(True, DEFAULT_MAX_SIZE)
+        jsons.clear_cache()
+
+    def test_set_serializer_after_dump(self):
+        fork_inst = jsons.fork()
+        self.assertDictEqual({'x': 1}, jsons.dump(C(1), fork_inst=fork_inst))
+
+        jsons.set_serializer(lambda obj, **_: 'custom', C,
+                             fork_inst=fork_inst)
+
+        self.assertEqual('custom', jsons.dump(C(1), fork_inst=fork_inst))
+
+    def test_set_deserializer_after_load(self):
+        fork_inst = jsons.fork()
+        self.assertEqual(1, jsons.load({'x': 1}, C, fork_inst=fork_inst).x)
+
+        jsons.set_deserializer(lambda obj, cls, **_: C(42), C,
+                               fork_inst=fork_inst)
+
+        self.assertEqual(42, jsons.load({'x': 1}, C, fork_inst=fork_inst).x)
+
+    def test_persist_cache(self):
+        jsons.clear_cache()
+        jsons.dump(C(1))
+        self.assertTrue(any(w.cached.cache_info().currsize
+                            for w in _Wrapper.instances))
+
+        jsons.persist_cache(False)
+        jsons.dump(C(1))
+        self.assertFalse(any(w.cached.cache_info().currsize
+                             for w in _Wrapper.instances))
+
+    def test_persist_cache_max_size(self):
+        jsons.persist_cache(True, 2)
+        jsons.dump([C(1), 'a', 2, 3.0, None])
+        self.assertTrue(all(w.cached.cache_info().maxsize == 2
+                            for w in _Wrapper.instances))
+
+    def test_set_serializer_keeps_cache_of_other_forks(self):
+        fork1 = jsons.fork()
+        fork2 = jsons.fork()
+        jsons.dump(C(1), fork_inst=fork1)
+        jsons.dump(C(1), fork_inst=fork2)
+        generation2 = fork2._generation
+
+        jsons.set_serializer(lambda obj, **_: 'custom', C, fork_inst=fork1)
+
+        self.assertEqual(generation2, fork2._generation)
+        self.assertIn(C, fork2._serializers_dispatch)
+        self.assertNotIn(C, fork1._serializers_dispatch)
+        self.assertEqual('custom', jsons.dump(C(1), fork_inst=fork1))
+        self.assertDictEqual({'x': 1}, jsons.dump(C(1), fork_inst=fork2))
+
+    def test_get_serializer_dispatch(self):
+        fork_inst = jsons.fork()
+        serializer = jsons.get_serializer(C, fork_inst)
+
+        self.assertIs(serializer, fork_inst._serializers_dispatch[C])
+        self.assertNotIn(C, jsons.fork()._serializers_dispatch)
+
+    def test_set_validator_invalidates_own_fork_only(self):
+        fork_inst = jsons.fork()
+        generation = fork_inst._generation
+        global_generation = jsons.JsonSerializable._generation
+
+        jsons.set_validator(lambda _: True, C, fork_inst=fork_inst)
+
+        # Every fork has its own validators.
+        self.assertNotEqual(generation, fork_inst._generation)
+        self.assertEqual(global_generation,
+                         jsons.JsonSerializable._generation)
+        self.assertIsNot(fork_inst._validators, jsons.fork()._validators)
+        self.assertEqual(len(fork_inst._validators) - 1,
+                         len(jsons.fork()._validators))
+
+    def test_announce_class_keeps_cache(self):
+        class D:
+            pass
+
+        fork_inst = jsons.fork()
+        generation = fork_inst._generation
+
+        jsons.announce_class(D, 'first', fork_inst=fork_inst)
+        jsons.announce_class(D, 'second', fork_inst=fork_inst)
+        jsons.announce_class(D, 'first', fork_inst=fork_inst)
+
+        self.assertEqual(generation, fork_inst._generation)
+        self.assertEqual('first', fork_inst._announced_classes[D])
+
+    def test_no_clearing_while_other_call_is_running(self):
+        jsons.persist_cache(False)
+        start_call()  # E.g. a load on another thread.
+        try:
+            jsons.dump(C(1))
+            self.assertTrue(any(w.cached.cache_info().currsize
+                                for w in _Wrapper.instances))
+        finally:
+            end_call()
+        self.assertFalse(any(w.cached.cache_info().currsize
+                             for w in _Wrapper.instances))
+
+    def test_set_serializer_replaces_registries(self):
+        fork_inst = jsons.fork()
+        sub_fork = type('SubFork', (fork_inst,), {})
+        serializers = fork_inst._serializers
+        classes = fork_inst._classes_serializers
+
+        jsons.set_serializer(lambda obj, **_: 'custom', C,
+                             fork_inst=sub_fork)
+
+        self.assertNotIn('tests.test_cache.c', serializers)
+        self.assertNotIn(C, classes)
+        # The registries are replaced on the fork that holds them.
+        self.assertIs(fork_inst._serializers, sub_fork._serializers)
+        self.assertEqual('custom', jsons.dump(C(1), fork_inst=fork_inst))
+
+    def test_set_serializer_while_dumping_on_other_threads(self):
+        fork_inst = jsons.fork()
+        jsons.persist_cache(False)
+        errors = []
+
+        def _dump():
+            try:
+                for _ in range(200):
+                    jsons.dump([C(1), {'a': C(2)}], fork_inst=fork_inst)
+            except Exception as err:
+                errors.append(err)
+
+        threads = [Thread(target=_dump) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for i in range(200):
+            cls = type('C{}'.format(i), (C,), {})
+            jsons.set_serializer(lambda obj, **_: obj.x, cls,
+                                 fork_inst=fork_inst)
+        for thread in threads:
+            thread.join()
+
+        self.assertListEqual([], errors)
+
+    def test_dispatch_is_bounded(self):
+        fork_inst = jsons.fork()
+        jsons.persist_cache(True, 4)
+        types = [type('T{}'.format(i), (C,), {}) for i in range(10)]
+
+        for cls in types:
+            jsons.get_deserializer(cls, fork_inst)
+
+        self.assertLessEqual(len(fork_inst._deserializers_dispatch), 4)
+        self.assertIn(types[-1], fork_inst._deserializers_dispatch)
+
+    def test_clear_cache_resets_dispatch(self):
+        fork_inst = jsons.fork()
+        sub_fork = jsons.fork(fork_inst)
+        jsons.dump(C(1), fork_inst=fork_inst)
+        jsons.load({'x': 1}, C, fork_inst=sub_fork)
+
+        jsons.clear_cache()
+
+        self.assertDictEqual({}, fork_inst._serializers_dispatch)
+        self.assertDictEqual({}, sub_fork._deserializers_dispatch)
+        self.assertDictEqual({}, jsons.JsonSerializable._serializers_dispatch)
+
+        jsons.persist_cache(False)
+        jsons.dump(C(1), fork_inst=fork_inst)
+
+        self.assertDictEqual({}, fork_inst._serializers_dispatch)
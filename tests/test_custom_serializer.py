@@ -15,6 +15,46 @@ class TestCustomSerializer(TestCase):
         self.assertEqual(dumped, 'custom_serializer')
         self.assertEqual(loaded, 'custom_deserializer')
 
+    def test_most_specific_serializer_is_used(self):
+        class Base:
+            pass
+
+        class Child(Base):
+            pass
+
+        class GrandChild(Child):
+            pass
+
+        fork_inst = jsons.fork()
+        jsons.set_serializer(lambda *_, **__: 'child', Child,
+                             fork_inst=fork_inst)
+        jsons.set_serializer(lambda *_, **__: 'base', Base,
+                             fork_inst=fork_inst)
+
+        self.assertEqual('child', jsons.dump(GrandChild(),
+                                             fork_inst=fork_inst))
+        self.assertEqual('base', jsons.dump(Base(), fork_inst=fork_inst))
+
+    def test_equally_specific_serializers_by_priority(self):
+        class A:
+            pass
+
+        class B:
+            pass
+
+        class AB(A, B):
+            pass
+
+        fork_inst = jsons.fork()
+        jsons.set_serializer(lambda *_, **__: 'a', A, fork_inst=fork_inst)
+        jsons.set_serializer(lambda *_, **__: 'b', B, fork_inst=fork_inst)
+
+        self.assertEqual('b', jsons.dump(AB(), fork_inst=fork_inst))
+
+        jsons.set_serializer(lambda *_, **__: 'a', A, fork_inst=fork_inst)
+
+        self.assertEqual('a', jsons.dump(AB(), fork_inst=fork_inst))
+
     @classmethod
     def tearDownClass(cls):
         jsons.set_serializer(default_primitive_serializer, str)
@@ -1,10 +1,12 @@
 import datetime
 import warnings
 from unittest import TestCase
+from unittest.mock import patch
 
 import jsons
+from jsons._cache import end_call, start_call
 from jsons._common_impl import StateHolder
-from jsons._datetime_impl import get_offset_str
+from jsons._datetime_impl import get_offset_str, _get_local_timezone
 
 
 class TestDatetime(TestCase):
@@ -68,6 +70,15 @@ class TestDatetime(TestCase):
         dumped = jsons.dump(dat)
         self.assertEqual(dumped, '2018-07-08T21:34:00-02:00')
 
+    def test_dump_load_datetime_subclass(self):
+        class SubDatetime(datetime.datetime):
+            pass
+
+        dt = SubDatetime(2018, 7, 8, 21, 34, 20, tzinfo=datetime.timezone.utc)
+
+        self.assertEqual('2018-07-08T21:34:20Z', jsons.dump(dt))
+        self.assertEqual(dt, jsons.load('2018-07-08T21:34:20Z', SubDatetime))
+
     def test_load_datetime(self):
         dat = datetime.datetime(year=2018, month=7, day=8, hour=21, minute=34,
                                 tzinfo=datetime.timezone.utc)
@@ -86,6 +97,38 @@ class TestDatetime(TestCase):
         loaded = jsons.load('2018-07-08T21:34:00-02:00')
         self.assertEqual(loaded, dat)
 
+    def test_load_datetime_with_fractions(self):
+        tzinfo = datetime.timezone(datetime.timedelta(hours=5, minutes=30))
+        for fraction, microsecond in (('1', 100000), ('123', 123000),
+                                      ('12345', 123450),
+                                      ('123456789', 123456)):
+            loaded = jsons.load('2018-07-08T21:34:00.{}+05:30'
+                                .format(fraction), datetime.datetime)
+            self.assertEqual(microsecond, loaded.microsecond)
+            self.assertEqual(tzinfo, loaded.tzinfo)
+
+    def test_load_datetime_shares_timezones(self):
+        loaded1 = jsons.load('2018-07-08T21:34:00+01:00', datetime.datetime)
+        loaded2 = jsons.load('2019-01-01T00:00:00.5+01:00', datetime.datetime)
+
+        self.assertIs(loaded1.tzinfo, loaded2.tzinfo)
+        self.assertIs(datetime.timezone.utc,
+                      jsons.load('2018-07-08T21:34:00+00:00').tzinfo)
+
+    def test_load_datetime_uncommon_form(self):
+        # Valid for strptime, though not in the common RFC3339 form.
+        dat = datetime.datetime(year=2018, month=7, day=8, hour=1, minute=4,
+                                tzinfo=datetime.timezone.utc)
+        self.assertEqual(dat, jsons.load('2018-7-8T1:4:0Z',
+                                         datetime.datetime))
+
+    def test_load_invalid_datetime(self):
+        for obj in ('2018-07-08T21:34:00', '2018-07-08 21:34:00Z',
+                    '2018-07-08T24:00:00Z', '2018-07-08T21:34:00.12Z+01:00',
+                    '2018-02-30T21:34:00+01:00', '2018-07-08T21:34:00+1'):
+            with self.assertRaises(jsons.DeserializationError):
+                jsons.load(obj, datetime.datetime)
+
     def test_get_offset_str(self):
         dat = datetime.datetime(year=2018, month=7, day=8, hour=21, minute=34,
                                 tzinfo=datetime.timezone.utc)
@@ -102,3 +145,63 @@ class TestDatetime(TestCase):
         self.assertEqual('Z', offset_str_dat)
         self.assertEqual('+03:00', offset_str_dat2)
         self.assertEqual('+03:00', offset_str_td)
+
+    def test_dump_datetime_offsets(self):
+        tz1 = datetime.timezone(datetime.timedelta(hours=5, minutes=30))
+        tz2 = datetime.timezone(datetime.timedelta(hours=5, minutes=30), 'X')
+        tz3 = datetime.timezone(datetime.timedelta(0), 'GMT')
+        for tzinfo, expected in ((tz1, '2018-07-08T21:34:00.5+05:30'),
+                                 (tz2, '2018-07-08T21:34:00.5+05:30'),
+                                 (datetime.timezone.utc,
+                                  '2018-07-08T21:34:00.5Z')):
+            dat = datetime.datetime(year=2018, month=7, day=8, hour=21,
+                                    minute=34, microsecond=500000,
+                                    tzinfo=tzinfo)
+            dumped = jsons.dump(dat)
+            self.assertEqual(expected, dumped.replace('.500000', '.5'))
+
+        # An equal timezone with another name may get another offset.
+        dat = datetime.datetime(year=2018, month=7, day=8, tzinfo=tz3)
+        self.assertFalse(jsons.dump(dat).endswith('Z'))
+
+    def test_dump_datetime_early_year(self):
+        dat = datetime.datetime(year=999, month=7, day=8,
+                                tzinfo=datetime.timezone.utc)
+        self.assertEqual(dat.strftime('%Y-%m-%dT%H:%M:%SZ'), jsons.dump(dat))
+
+    def test_dump_date_and_time(self):
+        tzinfo = datetime.timezone(datetime.timedelta(hours=-2))
+        tim = datetime.time(hour=21, minute=34, microsecond=5, tzinfo=tzinfo)
+        self.assertEqual('2018-07-08', jsons.dump(datetime.date(2018, 7, 8)))
+        self.assertEqual('21:34:00.000005', jsons.dump(tim))
+        self.assertEqual('21:34:00', jsons.dump(tim.replace(microsecond=0)))
+
+    def test_local_timezone_is_resolved_every_minute(self):
+        other = datetime.timezone(datetime.timedelta(hours=5, minutes=45))
+        local = datetime.datetime.now(datetime.timezone.utc).astimezone()
+        start_call()  # E.g. a load on another thread that stays running.
+        try:
+            with patch('jsons._datetime_impl._local_timezone', (1, other)):
+                with patch('jsons._datetime_impl.timestamp',
+                           return_value=119):
+                    tzone1 = _get_local_timezone()
+                with patch('jsons._datetime_impl.timestamp',
+                           return_value=120):
+                    tzone2 = _get_local_timezone()
+        finally:
+            end_call()
+
+        self.assertIs(other, tzone1)
+        self.assertEqual(local.utcoffset(), tzone2.utcoffset(None))
+
+    def test_load_datetime_interned_timezones_are_bounded(self):
+        with patch('jsons._datetime_impl._timezones', {}) as timezones, \
+                patch('jsons._datetime_impl.MAX_TIMEZONES', 2):
+            for offset in ('+01:00', '+02:00', '+03:00', '+03:00'):
+                jsons.load('2018-07-08T21:34:00' + offset, datetime.datetime)
+            loaded = jsons.load('2018-07-08T21:34:00+03:00',
+                                datetime.datetime)
+
+            self.assertListEqual(['+01:00', '+02:00'], list(timezones))
+            self.assertEqual(datetime.timedelta(hours=3),
+                             loaded.utcoffset())
@@ -0,0 +1,137 @@
+import io
+import json
+from multiprocessing import Process
+from typing import List
+from unittest import TestCase
+from unittest.mock import patch
+
+import jsons
+from jsons import (
+    _multitasking,
+    DeserializationError,
+    DecodeError,
+    SerializationError,
+    JsonsError,
+)
+from jsons._common_impl import StateHolder
+
+
+class C:
+    def __init__(self, x: int, y: List[int]):
+        self.x = x
+        self.y = y
+
+
+class TestDumpLinesAndLoadLines(TestCase):
+    def test_dump_lines(self):
+        objs = [C(1, [1, 2]), {'a': C(2, [])}, 3, 'x', None]
+        fp = io.StringIO()
+
+        jsons.dump_lines(objs, fp, jdkwargs={'indent': 2})
+
+        expected = ''.join(jsons.dumps(obj) + '\n' for obj in objs)
+        self.assertEqual(expected, fp.getvalue())
+
+    def test_dump_lines_with_cls(self):
+        fp = io.BytesIO()
+
+        jsons.dump_lines(['1', '2'], fp, cls=int)
+
+        self.assertEqual(b'1\n2\n', fp.getvalue())
+
+    def test_dump_lines_error(self):
+        fp = io.StringIO()
+
+        with self.assertRaises(SerializationError):
+            jsons.dump_lines(['1', 'x'], fp, cls=int)
+
+        self.assertEqual('1\n', fp.getvalue())
+
+    def test_load_lines(self):
+        objs = [C(i, list(range(i))) for i in range(5)]
+        fp = io.StringIO()
+        jsons.dump_lines(objs, fp)
+        fp.seek(0)
+
+        loaded = jsons.load_lines(fp, C)
+
+        self.assertNotIsInstance(loaded, list)
+        self.assertEqual(jsons.dump(objs), jsons.dump(list(loaded)))
+
+    def test_load_lines_binary(self):
+        lines = ['{"a": "é"}', '', '  ', '[1, 2]\r', '"x"']
+        fp = io.BytesIO('\n'.join(lines).encode('utf-16'))
+
+        loaded = list(jsons.load_lines(fp, encoding='utf-16'))
+
+        self.assertEqual([{'a': 'é'}, [1, 2], 'x'], loaded)
+
+    def test_load_lines_error(self):
+        fp = io.StringIO('{"x": 1, "y": []}\n{"x": "a", "y": []}\n')
+        loaded = jsons.load_lines(fp, C)
+
+        self.assertEqual(1, next(loaded).x)
+        with self.assertRaises(DeserializationError) as ctx:
+            next(loaded)
+        self.assertIn('line 2', ctx.exception.message)
+
+        with self.assertRaises(DecodeError):
+            list(jsons.load_lines(io.StringIO('1\n{"x": \n'), int))
+
+    def test_load_lines_json_serializable(self):
+        class D(jsons.JsonSerializable):
+            def __init__(self, x: int):
+                self.x = x
+
+        loaded = D.load_lines(io.StringIO(json.dumps({'x': 1}) + '\n'))
+
+        self.assertEqual([1], [d.x for d in loaded])
+
+    def test_load_lines_with_workers(self):
+        objs = [C(i, [i] * (i % 3)) for i in range(50)]
+        fp = io.BytesIO()
+        jsons.dump_lines(objs, fp)
+        dumped = fp.getvalue()
+
+        with patch('jsons._lines_impl.CHUNK_SIZE', 100):
+            loaded = list(jsons.load_lines(io.BytesIO(dumped), C, workers=2))
+            unordered = list(jsons.load_lines(io.BytesIO(dumped), C,
+                                              workers=2, ordered=False))
+
+        self.assertEqual(jsons.dump(objs), jsons.dump(loaded))
+        self.assertEqual(sorted(obj.x for obj in objs),
+                         sorted(obj.x for obj in unordered))
+
+    def test_load_lines_with_workers_uses_persistent_pool(self):
+        lines = '{"x": 1, "y": []}\n{"x": 2, "y": [3]}\n'
+        pool = _multitasking._get_pool(Process, 2, StateHolder)
+
+        with patch.object(pool, 'submit', wraps=pool.submit) as submit_mock:
+            loaded = list(jsons.load_lines(io.StringIO(lines), C, workers=2))
+
+        self.assertEqual([1, 2], [obj.x for obj in loaded])
+        self.assertEqual(1, submit_mock.call_count)
+
+    def test_load_lines_with_workers_and_fork(self):
+        fork_inst = jsons.fork()
+        jsons.set_deserializer(lambda obj, *_, **__: int(obj) * 2, int,
+                               fork_inst=fork_inst)
+        lines = '{"X": 1, "Y": []}\n{"X": 2, "Y": [3]}\n'
+
+        loaded = list(jsons.load_lines(io.StringIO(lines), C, workers=2,
+                                       fork_inst=fork_inst, strict=True,
+                                       key_transformer=str.lower))
+
+        self.assertEqual([2, 4], [obj.x for obj in loaded])
+        self.assertEqual([[], [6]], [obj.y for obj in loaded])
+
+    def test_load_lines_with_workers_error(self):
+        lines = '{"x": 1, "y": []}\n' * 10 + '{"x": "a", "y": []}\n'
+
+        with patch('jsons._lines_impl.CHUNK_SIZE', 40):
+            with self.assertRaises(DeserializationError) as ctx:
+                list(jsons.load_lines(io.StringIO(lines), C, workers=2))
+            with self.assertRaises(JsonsError):
+                jsons.load_lines(io.StringIO(lines), C, workers=0)
+
+        self.assertIn('line 11', ctx.exception.message)
@@ -0,0 +1,201 @@
+import io
+import json
+from typing import List, Dict, Mapping
+from unittest import TestCase
+from unittest.mock import patch
+
+import jsons
+from jsons import SerializationError, DeserializationError, DecodeError
+
+
+class C:
+    def __init__(self, x: int, y: List[int]):
+        self.x = x
+        self.y = y
+
+
+class TestDumpToAndLoadFrom(TestCase):
+    def test_dump_to_text(self):
+        obj = {'a': [C(1, [1, 2]), C(2, [])], 'b': (1, 'x', None), 'c': {}}
+        fp = io.StringIO()
+
+        jsons.dump_to(obj, fp)
+
+        self.assertEqual(jsons.dumps(obj), fp.getvalue())
+
+    def test_dump_to_binary(self):
+        fp = io.BytesIO()
+
+        jsons.dump_to(['a', 'é'], fp, encoding='utf-8',
+                      jdkwargs={'ensure_ascii': False})
+
+        self.assertEqual('["a", "é"]'.encode('utf-8'), fp.getvalue())
+
+    def test_dump_to_with_jdkwargs(self):
+        obj = [{'b': [], 'a': [1, {'c': None}]}, [], {}, 'x']
+        for jdkwargs in ({'indent': 2},
+                         {'indent': '\t', 'sort_keys': True},
+                         {'separators': (',', ':')}):
+            fp = io.StringIO()
+
+            jsons.dump_to(obj, fp, jdkwargs=jdkwargs, strip_nulls=True)
+
+            self.assertEqual(jsons.dumps(obj, jdkwargs=jdkwargs,
+                                         strip_nulls=True), fp.getvalue())
+
+    def test_dump_to_with_hashed_keys(self):
+        obj = {(1, 2): 'a', 'b': 'c'}
+        fp = io.StringIO()
+
+        jsons.dump_to(obj, fp)
+
+        self.assertDictEqual(json.loads(jsons.dumps(obj)),
+                             json.loads(fp.getvalue()))
+
+    def test_dump_to_with_custom_serializer(self):
+        fork_inst = jsons.fork()
+        jsons.set_serializer(lambda obj, **_: obj.x, C, fork_inst=fork_inst)
+        fp = io.StringIO()
+
+        jsons.dump_to([C(1, []), C(2, [])], fp, fork_inst=fork_inst)
+
+        self.assertEqual('[1, 2]', fp.getvalue())
+
+    def test_dump_to_verbose(self):
+        fp = io.StringIO()
+
+        jsons.dump_to([C(1, [])], fp, verbose=True)
+
+        expected = jsons.dump(C(1, []), verbose=True)['-meta']['classes']
+        meta = json.loads(fp.getvalue())[0]['-meta']
+        self.assertEqual(expected, meta['classes'])
+
+    def test_dump_to_error(self):
+        with self.assertRaises(SerializationError):
+            jsons.dump_to(['1', 'x'], io.StringIO(), cls=List[int])
+
+    def test_dump_to_json_serializable(self):
+        class D(jsons.JsonSerializable):
+            def __init__(self, x: int):
+                self.x = x
+
+        fp = io.StringIO()
+
+        D(42).dump_to(fp)
+
+        self.assertEqual('{"x": 42}', fp.getvalue())
+
+    def test_load_from_text(self):
+        obj = [C(1, [1, 2]), C(2, [])]
+        fp = io.StringIO(jsons.dumps(obj))
+
+        loaded = jsons.load_from(fp, List[C])
+
+        self.assertEqual(jsons.dump(obj), jsons.dump(loaded))
+        self.assertTrue(all(isinstance(elem, C) for elem in loaded))
+
+    def test_load_from_binary(self):
+        fp = io.BytesIO('{"a": "é", "b": "ü"}'.encode('utf-16'))
+
+        loaded = jsons.load_from(fp, Dict[str, str], encoding='utf-16')
+
+        self.assertDictEqual({'a': 'é', 'b': 'ü'}, loaded)
+
+    def test_load_from_small_chunks(self):
+        obj = {str(i): C(i * 12345, list(range(i))) for i in range(20)}
+        dumped = jsons.dumps(obj, jdkwargs={'indent': 2})
+
+        with patch('jsons._stream_impl.BUFFER_SIZE', 3):
+            loaded = jsons.load_from(io.StringIO(dumped), Dict[str, C])
+            loaded_mapping = jsons.load_from(io.StringIO(dumped),
+                                             Mapping[str, C])
+
+        self.assertEqual(jsons.dump(obj), jsons.dump(loaded))
+        self.assertEqual(jsons.dump(obj), jsons.dump(loaded_mapping))
+
+    def test_load_from_number_across_chunks(self):
+        for number in ('11.5', '-2e10', '1234567', '0.25E-3'):
+            dumped = '[{}, {}]'.format('1' * 5, number)
+            for size in range(1, len(dumped)):
+                with patch('jsons._stream_impl.BUFFER_SIZE', size):
+                    loaded = jsons.load_from(io.StringIO(dumped),
+                                             List[float])
+                    iter_loaded = list(jsons.iter_load(io.StringIO(dumped),
+                                                       float))
+
+                self.assertListEqual(json.loads(dumped), loaded)
+                self.assertListEqual(json.loads(dumped), iter_loaded)
+
+    def test_load_from_without_cls(self):
+        for dumped in ('[1, 2.5, "x", null, {"a": []}]', '{"a": [1]}',
+                       '123456789', ' "x" '):
+            self.assertEqual(json.loads(dumped),
+                             jsons.load_from(io.StringIO(dumped)))
+
+    def test_load_from_with_hashed_keys(self):
+        obj = {(1, 2): 'a', 'b': 'c'}
+        fp = io.StringIO(jsons.dumps(obj))
+
+        self.assertDictEqual(obj, jsons.load_from(fp, Dict[tuple, str]))
+
+    def test_load_from_with_key_transformer(self):
+        fp = io.StringIO('{"someKey": {"x": 1, "y": []}}')
+
+        snakecase = jsons.KEY_TRANSFORMER_SNAKECASE
+        loaded = jsons.load_from(fp, Dict[str, C], key_transformer=snakecase)
+
+        self.assertEqual(['some_key'], list(loaded))
+
+    def test_load_from_invalid_json(self):
+        for dumped in ('', '[1, 2', '[1 2]', '[1,]', '{"a" 1}', '{"a": 1,}',
+                       '[1] 2', '{"a": tru}'):
+            with self.assertRaises(DecodeError):
+                jsons.load_from(io.StringIO(dumped), List[int]
+                                if dumped.startswith('[') else Dict[str, int])
+
+    def test_load_from_error(self):
+        with self.assertRaises(DeserializationError) as ctx:
+            jsons.load_from(io.StringIO('[1, "x"]'), List[int])
+
+        self.assertIn('index 1', ctx.exception.message)
+
+    def test_load_from_json_serializable(self):
+        class D(jsons.JsonSerializable):
+            def __init__(self, x: int):
+                self.x = x
+
+        self.assertEqual(42, D.load_from(io.StringIO('{"x": 42}')).x)
+
+    def test_iter_load(self):
+        obj = [C(i, list(range(i))) for i in range(100)]
+        fp = io.StringIO(jsons.dumps(obj))
+
+        with patch('jsons._stream_impl.BUFFER_SIZE', 16):
+            loaded = jsons.iter_load(fp, C)
+            first = next(loaded)
+
+            self.assertIsInstance(first, C)
+            self.assertLess(fp.tell(), len(fp.getvalue()) // 2)
+            self.assertEqual(jsons.dump(obj),
+                             jsons.dump([first] + list(loaded)))
+
+    def test_iter_load_empty_and_invalid(self):
+        self.assertEqual([], list(jsons.iter_load(io.StringIO(' [ ] '), C)))
+
+        loaded = jsons.iter_load(io.StringIO('[1, 2 3]'), int)
+        self.assertEqual(1, next(loaded))
+        self.assertEqual(2, next(loaded))
+        with self.assertRaises(DecodeError):
+            next(loaded)
+
+        with self.assertRaises(DecodeError):
+            list(jsons.iter_load(io.StringIO('{"x": 1}'), int))
+
+    def test_iter_load_json_serializable(self):
+        class D(jsons.JsonSerializable):
+            def __init__(self, x: int):
+                self.x = x
+
+        loaded = D.iter_load(io.BytesIO(b'[{"x": 1}, {"x": 2}]'))
+
+        self.assertEqual([1, 2], [d.x for d in loaded])
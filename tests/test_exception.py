@@ -1,3 +1,4 @@
+import pickle
 from unittest import TestCase
 
 import jsons
@@ -34,3 +35,15 @@ class TestException(TestCase):
     def test_exception_wrong_bytes(self):
         with self.assertRaises(DeserializationError):
             jsons.loadb('{"key": "value"}')
+
+    def test_exception_pickle(self):
+        try:
+            jsons.loads('[1, 2', int)
+        except DecodeError as err:
+            unpickled = pickle.loads(pickle.dumps(err))
+
+            self.assertIsInstance(unpickled, DecodeError)
+            self.assertEqual(err.message, unpickled.message)
+            self.assertEqual(err.source, unpickled.source)
+            self.assertEqual(int, unpickled.target)
+            self.assertEqual(err.pos, unpickled.pos)
@@ -4,12 +4,22 @@ from multiprocessing import Process
 from threading import Thread
 from typing import List
 from unittest import TestCase
+from unittest.mock import patch
 
 import jsons
 from jsons import _multitasking, DeserializationError
 from jsons.exceptions import JsonsError
 
 
+class Base:
+    def __init__(self, x: int):
+        self.x = x
+
+
+class Sub(Base):
+    pass
+
+
 class TestList(TestCase):
     def test_dump_list(self):
         d = datetime.datetime(year=2018, month=7, day=8, hour=21, minute=34,
@@ -49,6 +59,15 @@ class TestList(TestCase):
         dumped = jsons.dump(l, strict=True)
         self.assertListEqual(expected, dumped)
 
+    def test_dump_list_with_mixed_types(self):
+        fork_inst = jsons.fork()
+        jsons.set_serializer(lambda obj, **_: 'sub', Sub, fork_inst=fork_inst)
+
+        dumped = jsons.dump([Base(1), Sub(2), 3, Base(4), Sub(5), None],
+                            fork_inst=fork_inst)
+
+        self.assertEqual([{'x': 1}, 'sub', 3, {'x': 4}, 'sub', None], dumped)
+
     # Note: mock.patch won't work because of a subclass check.
     def test_dump_list_multiprocess(self):
         class ProcessMock(Process):
@@ -67,10 +86,9 @@ class TestList(TestCase):
             def list(self, l, *_, **__):
                 return l
 
-        jsons._multitasking.Manager = ManagerMock
-
-        dumped = jsons.dump(['1', '1', '1', '1'], List[int], strict=True,
-                            tasks=2, task_type=ProcessMock)
+        with patch('jsons._multitasking.Manager', ManagerMock):
+            dumped = jsons.dump(['1', '1', '1', '1'], List[int], strict=True,
+                                tasks=2, task_type=ProcessMock)
         self.assertEqual([1, 1, 1, 1], dumped)
 
     def test_load_list(self):
@@ -136,11 +154,11 @@ class TestList(TestCase):
             def list(self, l, *_, **__):
                 return l
 
-        jsons._multitasking.Manager = ManagerMock
+        with patch('jsons._multitasking.Manager', ManagerMock):
+            loaded = jsons.load(['1', '1', '1', '1'], List[int], tasks=2,
+                                task_type=ProcessMock)
 
-        self.assertEqual([1, 1, 1, 1], jsons.load(['1', '1', '1', '1'],
-                                                  List[int], tasks=2,
-                                                  task_type=ProcessMock))
+        self.assertEqual([1, 1, 1, 1], loaded)
 
     def test_load_list_with_generic(self):
         class C:
@@ -155,6 +173,26 @@ class TestList(TestCase):
         self.assertEqual(expectation[1].x, loaded[1].x)
         self.assertEqual(expectation[1].y, loaded[1].y)
 
+    def test_load_homogeneous_list_of_primitives(self):
+        loaded_floats = jsons.load([1, 2.5, True], List[float], strict=True)
+        loaded_ints = jsons.load([1, True, 3], List[int], strict=True)
+
+        self.assertEqual([1.0, 2.5, 1.0], loaded_floats)
+        self.assertTrue(all(type(elem) is float for elem in loaded_floats))
+        self.assertEqual([1, True, 3], loaded_ints)
+        self.assertIs(True, loaded_ints[1])
+        self.assertEqual([1, 2], jsons.load(['1', 2], List[int]))
+        with self.assertRaises(DeserializationError):
+            jsons.load([1, None], List[int])
+
+    def test_load_list_with_generic_and_meta(self):
+        dumped = jsons.dump([Base(1), Sub(2)], List[Base], verbose=True)
+        loaded = jsons.load(dumped, List[Base])
+
+        self.assertEqual(Base, type(loaded[0]))
+        self.assertEqual(Sub, type(loaded[1]))
+        self.assertEqual(2, loaded[1].x)
+
     def test_load_error_points_at_index(self):
         class C:
             def __init__(self, x: str, y: int):
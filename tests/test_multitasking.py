@@ -0,0 +1,133 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from multiprocessing import Process
+from threading import Thread
+from typing import Dict, List
+from unittest import TestCase
+
+import jsons
+from jsons import _multitasking
+
+
+class ExecutorMock(ThreadPoolExecutor):
+    def __init__(self):
+        ThreadPoolExecutor.__init__(self, 2)
+        self.slices = []
+
+    def map(self, fn, *iterables, **kwargs):
+        self.slices.extend(*iterables)
+        return ThreadPoolExecutor.map(self, fn, *iterables, **kwargs)
+
+
+class TestMultitasking(TestCase):
+    def tearDown(self):
+        jsons.shutdown_pools()
+
+    def test_pools_are_reused(self):
+        loaded1 = jsons.load(['1', '2', '3'], List[int], tasks=2,
+                             task_type=Thread)
+        pool = _multitasking._get_pool(Thread, 2, jsons.JsonSerializable)
+        loaded2 = jsons.load(['4', '5'], List[int], tasks=2, task_type=Thread)
+
+        self.assertEqual([1, 2, 3], loaded1)
+        self.assertEqual([4, 5], loaded2)
+        self.assertIs(pool, _multitasking._get_pool(Thread, 2,
+                                                    jsons.JsonSerializable))
+
+        jsons.shutdown_pools()
+
+        self.assertIsNot(pool, _multitasking._get_pool(Thread, 2,
+                                                       jsons.JsonSerializable))
+
+    def test_task_type_subclass_is_started(self):
+        started = []
+
+        class ThreadSub(Thread):
+            def start(self):
+                started.append(self)
+                Thread.start(self)
+
+        loaded = jsons.load(['1', '2', '3'], List[int], tasks=2,
+                            task_type=ThreadSub)
+
+        self.assertEqual([1, 2, 3], loaded)
+        self.assertEqual(2, len(started))
+        self.assertIsNone(_multitasking._get_pool(ThreadSub, 2,
+                                                  jsons.JsonSerializable))
+
+    def test_process_pool_is_renewed_on_change(self):
+        fork_inst = jsons.fork()
+        pool = _multitasking._get_pool(Process, 2, fork_inst)
+
+        self.assertIs(pool, _multitasking._get_pool(Process, 2, fork_inst))
+
+        jsons.set_deserializer(lambda obj, *_, **__: obj, str,
+                               fork_inst=fork_inst)
+
+        self.assertIsNot(pool, _multitasking._get_pool(Process, 2, fork_inst))
+
+    def test_set_executor(self):
+        executor = ExecutorMock()
+        fork_inst = jsons.fork()
+        jsons.set_executor(executor, fork_inst=fork_inst)
+        jsons.set_deserializer(lambda obj, *_, **__: 42, int,
+                               fork_inst=fork_inst)
+
+        loaded = jsons.load(['1', '2', '3', '4', '5'], List[int], tasks=2,
+                            fork_inst=fork_inst)
+
+        self.assertEqual([42] * 5, loaded)
+        self.assertEqual([['1', '2', '3'], ['4', '5']], executor.slices)
+        executor.shutdown()
+
+    def test_executor_kwarg(self):
+        executor = ExecutorMock()
+
+        loaded = jsons.load(['1', '2', '3'], List[int], tasks=3,
+                            executor=executor)
+        dumped = jsons.dump((4, 5), tasks=2, executor=executor)
+
+        self.assertEqual([1, 2, 3], loaded)
+        self.assertEqual([4, 5], dumped)
+        self.assertEqual([['1'], ['2'], ['3'], [(4, None)], [(5, None)]],
+                         executor.slices)
+        executor.shutdown()
+
+    def test_concurrent_calls_with_shared_executor(self):
+        dat = datetime(2018, 7, 8, 21, 34, tzinfo=timezone.utc)
+        dumped = ['2018-07-08T21:34:00Z'] * 20
+        results = []
+
+        def _task():
+            for _ in range(10):
+                results.append(jsons.load(dumped, List[datetime], tasks=4,
+                                          executor=executor))
+
+        with ThreadPoolExecutor(4) as executor:
+            jsons.persist_cache(False)
+            threads = [Thread(target=_task) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            jsons.persist_cache(True)
+
+        self.assertEqual(40, len(results))
+        self.assertTrue(all(result == [dat] * 20 for result in results))
+
+    def test_process_tasks_with_fork(self):
+        fork_inst = jsons.fork()
+        jsons.set_deserializer(lambda obj, *_, **__: int(obj) * 2, int,
+                               fork_inst=fork_inst)
+
+        loaded = jsons.load(['1', '2', '3'], List[int], tasks=2,
+                            task_type=Process, fork_inst=fork_inst)
+
+        self.assertEqual([2, 4, 6], loaded)
+
+    def test_process_tasks_with_lambda_kwarg(self):
+        loaded = jsons.load([{'A': 1}, {'B': 2}], List[Dict[str, int]],
+                            tasks=2, task_type=Process,
+                            key_transformer=lambda key: key.lower())
+
+        self.assertEqual([{'a': 1}, {'b': 2}], loaded)
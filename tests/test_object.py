@@ -4,9 +4,11 @@ from abc import ABC
 from enum import Enum
 from typing import List, Dict
 from unittest import TestCase
+from unittest.mock import patch
 
 import jsons
 from jsons._common_impl import StateHolder
+from jsons._compatibility_impl import get_type_hints
 from jsons.exceptions import SignatureMismatchError, UnknownClassError, \
     SerializationError
 
@@ -133,6 +135,30 @@ class TestObject(TestCase):
         self.assertDictEqual(exp1, dump1)
         self.assertDictEqual(exp2, dump2)
 
+    def test_dump_object_strip_attr_list_strict(self):
+        class C:
+            def __init__(self, x: int, y: int):
+                self.x = x
+                self.y = y
+
+        dumped = jsons.dump(C(1, 2), C, strict=True, strip_attr=['y'])
+        self.assertDictEqual({'x': 1}, dumped)
+
+    def test_dump_objects_with_different_attributes(self):
+        class C:
+            def __init__(self, x: int):
+                self.x = x
+
+        c1 = C(1)
+        c2 = C(2)
+        c2.y = 3
+        c3 = C(4)
+        c3.z = 5
+
+        dumped = jsons.dump([c1, c2, c3])
+        self.assertListEqual([{'x': 1}, {'x': 2, 'y': 3}, {'x': 4, 'z': 5}],
+                             dumped)
+
     def test_dump_abc_class(self):
         class A(ABC):
             pass
@@ -560,6 +586,60 @@ class TestObject(TestCase):
         self.assertEqual(1, len(w))
         self.assertIn('additional_attr', str(w[-1].message))
 
+    def test_load_object_reuses_plan(self):
+        class C:
+            def __init__(self, x: int, y: str = 'y'):
+                self.x = x
+                self.y = y
+
+        with patch('jsons.deserializers.default_object.get_type_hints',
+                   wraps=get_type_hints) as get_type_hints_mock:
+            loaded1 = jsons.load({'x': 1}, C)
+            loaded2 = jsons.load({'x': '2', 'y': 'z'}, C)
+
+        self.assertEqual(1, get_type_hints_mock.call_count)
+        self.assertEqual((1, 'y'), (loaded1.x, loaded1.y))
+        self.assertEqual((2, 'z'), (loaded2.x, loaded2.y))
+
+    def test_load_object_plan_holds_deserializers(self):
+        class B:
+            def __init__(self, y: int):
+                self.y = y
+
+        class A:
+            def __init__(self, b: B, c: datetime.datetime):
+                self.b = b
+                self.c = c
+
+        jsons.load({'b': {'y': 1}, 'c': '2018-07-08T21:34:00Z'}, A)
+        with patch('jsons._load_impl.get_deserializer',
+                   wraps=jsons.get_deserializer) as get_deserializer_mock:
+            loaded = jsons.load({'b': {'y': 2}, 'c': '2018-07-08T21:34:00Z'},
+                                A)
+
+        # Only the deserializer of A is looked up; the plan holds the others.
+        get_deserializer_mock.assert_called_once_with(A, StateHolder)
+        self.assertEqual(2, loaded.b.y)
+        self.assertEqual(2018, loaded.c.year)
+
+    def test_load_object_with_deserializer_set_after_load(self):
+        class B:
+            def __init__(self, y: int):
+                self.y = y
+
+        class A:
+            def __init__(self, b: B):
+                self.b = b
+
+        fork_inst = jsons.fork()
+        loaded1 = jsons.load({'b': {'y': 1}}, A, fork_inst=fork_inst)
+        jsons.set_deserializer(lambda obj, cls, **kwargs: B(42), B,
+                               fork_inst=fork_inst)
+        loaded2 = jsons.load({'b': {'y': 1}}, A, fork_inst=fork_inst)
+
+        self.assertEqual(1, loaded1.b.y)
+        self.assertEqual(42, loaded2.b.y)
+
 
 class ParentDumpable:
     _par_c = 10
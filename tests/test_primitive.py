@@ -1,8 +1,9 @@
+from typing import List
 from unittest import TestCase
 
 import jsons
 from jsons import DeserializationError
-from jsons.exceptions import SerializationError
+from jsons.exceptions import SerializationError, ValidationError
 
 
 class TestPrimitive(TestCase):
@@ -22,6 +23,46 @@ class TestPrimitive(TestCase):
     def test_dump_none(self):
         self.assertEqual(None, jsons.dump(None))
 
+    def test_dump_primitives_with_custom_serializer(self):
+        class C:
+            def __init__(self, x: int, y):
+                self.x = x
+                self.y = y
+
+        fork_inst = jsons.fork()
+        jsons.set_serializer(lambda obj, **_: obj * 2, int,
+                             fork_inst=fork_inst)
+
+        self.assertEqual(4, jsons.dump(2, fork_inst=fork_inst))
+        self.assertEqual([2, 'a', 4],
+                         jsons.dump([1, 'a', 2], fork_inst=fork_inst))
+        self.assertEqual({'a': 2, 'b': 'b'},
+                         jsons.dump({'a': 1, 'b': 'b'}, fork_inst=fork_inst))
+        self.assertEqual([2, 4], jsons.dump({1, 2}, fork_inst=fork_inst))
+        self.assertEqual({'x': 2, 'y': 4},
+                         jsons.dump(C(1, 2), fork_inst=fork_inst))
+        self.assertEqual(2, jsons.dump(2))
+
+    def test_load_primitives_with_custom_deserializer_or_validator(self):
+        fork_inst = jsons.fork()
+        jsons.set_deserializer(lambda obj, *_, **__: obj * 2, int,
+                               fork_inst=fork_inst)
+
+        self.assertEqual(4, jsons.load(2, int, fork_inst=fork_inst,
+                                       strict=True))
+        self.assertEqual([2, 4], jsons.load([1, 2], List[int],
+                                            fork_inst=fork_inst, strict=True))
+        self.assertEqual([1, 2], jsons.load([1, 2], List[int], strict=True))
+
+        jsons.set_validator(lambda s: s != 'invalid', str,
+                            fork_inst=fork_inst)
+        with self.assertRaises(ValidationError):
+            jsons.load(['valid', 'invalid'], List[str], fork_inst=fork_inst,
+                       strict=True)
+        self.assertEqual(['valid', 'invalid'],
+                         jsons.load(['valid', 'invalid'], List[str],
+                                    strict=True))
+
     def test_dump_and_cast(self):
 
         class C:
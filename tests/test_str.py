@@ -1,5 +1,6 @@
 from datetime import datetime
 from unittest import TestCase
+from unittest.mock import patch
 
 import jsons
 
@@ -31,3 +32,21 @@ class TestStr(TestCase):
         loaded = jsons.load({'x': '1025'}, C, strict=True, fork_inst=fork)
 
         self.assertIsInstance(loaded.x, datetime)
+
+    def test_string_is_not_loaded_as_datetime(self):
+        loaded = jsons.load(['2018-07-08T21:34:00Z', '2018-07-08', 'text'])
+
+        self.assertIsInstance(loaded[0], datetime)
+        self.assertListEqual(['2018-07-08', 'text'], loaded[1:])
+
+    def test_infer_datetimes_off(self):
+        loaded = jsons.load({'x': '2018-07-08T21:34:00Z'},
+                            infer_datetimes=False)
+
+        self.assertDictEqual({'x': '2018-07-08T21:34:00Z'}, loaded)
+
+    def test_ordinary_strings_are_not_parsed(self):
+        with patch('jsons.deserializers.default_string.load') as load_mock:
+            jsons.load(['text', '2018-07-08', '1234567890123456'])
+
+        load_mock.assert_not_called()
@@ -42,3 +42,16 @@ class TestTimeZone(TestCase):
 
         self.assertEqual(expectation1, loaded1)
         self.assertEqual(expectation2, loaded2)
+
+    def test_load_timezone_shares_instances(self):
+        tz = {
+            'name': 'Jsonistan',
+            'offset': 3600.0
+        }
+
+        loaded1 = jsons.load(tz, timezone)
+        loaded2 = jsons.load(dict(tz), timezone)
+        loaded3 = jsons.load({**tz, 'name': 'Jsonia'}, timezone)
+
+        self.assertIs(loaded1, loaded2)
+        self.assertEqual('Jsonia', loaded3.tzname(None))
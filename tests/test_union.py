@@ -2,6 +2,7 @@ import datetime
 import uuid
 from typing import Optional, Union
 from unittest import TestCase
+from unittest.mock import patch
 
 import jsons
 from jsons import (
@@ -165,3 +166,30 @@ class TestUnion(TestCase):
         # Now this will fail.
         with self.assertRaises(DeserializationError):
             jsons.load({'value': 'not good'}, cls=TestOptionalInt)
+
+    def test_load_union_skips_certain_failures(self):
+        class C:
+            def __init__(self, x: int):
+                self.x = x
+
+        with patch('jsons.deserializers.default_union.load',
+                   side_effect=jsons.load) as load_mock:
+            jsons.load(None, Optional[C])
+            jsons.load({'x': 1}, Union[int, C])
+            jsons.load(2, Union[C, None, int])
+
+        tried = [call[0][1] for call in load_mock.call_args_list]
+        self.assertListEqual([type(None), C, int], tried)
+
+    def test_load_union_order(self):
+        self.assertEqual(0, jsons.load(0, Union[int, float]))
+        self.assertIsInstance(jsons.load(0, Union[float, int]), float)
+
+    def test_load_union_with_custom_deserializer(self):
+        fork_inst = jsons.fork()
+        jsons.set_deserializer(lambda obj, cls, **kwargs: -1, int,
+                               fork_inst=fork_inst)
+
+        loaded = jsons.load({'x': 1}, Union[int, dict], fork_inst=fork_inst)
+
+        self.assertEqual(-1, loaded)